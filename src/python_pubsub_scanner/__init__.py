@@ -9,14 +9,18 @@ Zero external dependencies except requests for HTTP calls.
 
 __version__ = "0.1.0"
 
-from .analyze_event_flow import EventFlowAnalyzer, NamespacedItem
+from .agent_graph import AgentGraph
+from .analyze_event_flow import AgentParseCache, EventFlowAnalyzer, NamespacedItem
 from .generate_hierarchical_tree import generate_hierarchical_tree
-from .scanner import EventFlowScanner
+from .scanner import EventFlowScanner, ScanSummary
 
 __all__ = [
     "EventFlowScanner",
+    "ScanSummary",
     "EventFlowAnalyzer",
+    "AgentParseCache",
     "NamespacedItem",
+    "AgentGraph",
     "generate_hierarchical_tree",
     "__version__",
 ]
@@ -0,0 +1,174 @@
+"""
+Agent Graph
+
+Compact, integer-indexed view of the agent -> agent graph induced by the event flow
+(agent A reaches agent B when B subscribes to an event A publishes), for analytics
+that walk the graph repeatedly, such as cycle detection.
+"""
+from __future__ import annotations
+
+from array import array
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .analyze_event_flow import NamespacedItem
+
+
+class AgentGraph(NamedTuple):
+    """
+    Compressed sparse row (CSR) representation of the agent -> agent graph.
+
+    Agent ``i`` is ``agents[i]``; the ids of the agents it reaches are
+    ``targets[offsets[i]:offsets[i + 1]]``. Self-loops are not included.
+
+    Attributes:
+        agents: Agents ordered by integer id (sorted, so ids are deterministic)
+        agent_ids: Mapping of agent -> integer id
+        offsets: Start of each agent's neighbours in targets (one entry per agent, plus one)
+        targets: Neighbour ids of all agents, concatenated
+        edge_events: Events linking each edge, keyed by (publisher id, subscriber id), sorted
+    """
+    agents: Tuple[NamespacedItem, ...]
+    agent_ids: Dict[NamespacedItem, int]
+    offsets: array
+    targets: array
+    edge_events: Dict[Tuple[int, int], List[NamespacedItem]]
+
+    def neighbors(self, agent_id: int) -> array:
+        """
+        Get the ids of the agents directly reached by an agent
+
+        Args:
+            agent_id: Integer id of the agent
+
+        Returns:
+            Array of neighbour ids, in increasing order
+        """
+        return self.targets[self.offsets[agent_id]:self.offsets[agent_id + 1]]
+
+
+def build_agent_graph(
+        agents: Iterable[NamespacedItem],
+        publications: Mapping[NamespacedItem, Iterable[NamespacedItem]],
+        event_to_subscribers: Mapping[NamespacedItem, Iterable[NamespacedItem]]
+) -> AgentGraph:
+    """
+    Build the CSR agent graph from the analyzer adjacency mappings
+
+    Args:
+        agents: All known agents (agents with no edge still get an id)
+        publications: Mapping of agent -> published events
+        event_to_subscribers: Mapping of event -> subscriber agents
+
+    Returns:
+        The AgentGraph
+    """
+    # Plain lists: the label map already tells whether an edge is new, so the
+    # successor lists need no per-agent set to stay free of duplicates
+    successors: Dict[NamespacedItem, List[NamespacedItem]] = {agent: [] for agent in agents}
+    # Labels are collected in the same pass, so consumers never rescan the mappings per edge
+    labels: Dict[Tuple[NamespacedItem, NamespacedItem], List[NamespacedItem]] = {}
+    for agent, published_events in publications.items():
+        reached = successors.setdefault(agent, [])
+        for event in published_events:
+            for subscriber in event_to_subscribers.get(event, ()):
+                if subscriber == agent:  # Avoid self-loops
+                    continue
+                edge_labels = labels.get((agent, subscriber))
+                if edge_labels is None:
+                    labels[(agent, subscriber)] = [event]
+                    reached.append(subscriber)
+                    successors.setdefault(subscriber, [])
+                else:
+                    edge_labels.append(event)
+
+    ordered_agents = tuple(sorted(successors))
+    agent_ids = {agent: agent_id for agent_id, agent in enumerate(ordered_agents)}
+
+    offsets = array('l', [0])
+    targets = array('l')
+    for agent in ordered_agents:
+        targets.extend(sorted(agent_ids[neighbor] for neighbor in successors[agent]))
+        offsets.append(len(targets))
+
+    edge_events = {
+        (agent_ids[publisher], agent_ids[subscriber]): sorted(events)
+        for (publisher, subscriber), events in labels.items()
+    }
+
+    return AgentGraph(
+        agents=ordered_agents,
+        agent_ids=agent_ids,
+        offsets=offsets,
+        targets=targets,
+        edge_events=edge_events
+    )
+
+
+def strongly_connected_components(graph: AgentGraph) -> List[List[int]]:
+    """
+    Find the strongly connected components of an agent graph
+
+    Uses Tarjan's linear-time algorithm with an explicit work stack, so arbitrarily
+    deep graphs do not hit the interpreter recursion limit.
+
+    Args:
+        graph: The AgentGraph to decompose
+
+    Returns:
+        Every component as a list of agent ids, components in reverse topological order
+    """
+    offsets, targets = graph.offsets, graph.targets
+    agent_count = len(graph.agents)
+
+    order = [-1] * agent_count  # Discovery index of each agent, -1 while unvisited
+    lowlink = [0] * agent_count
+    on_stack = [False] * agent_count
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+
+    for root in range(agent_count):
+        if order[root] != -1:
+            continue
+
+        order[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        # Each frame is [agent, position of its next edge in targets]
+        work = [[root, offsets[root]]]
+
+        while work:
+            frame = work[-1]
+            agent, edge = frame
+            if edge < offsets[agent + 1]:
+                frame[1] = edge + 1
+                neighbor = targets[edge]
+                if order[neighbor] == -1:
+                    order[neighbor] = lowlink[neighbor] = counter
+                    counter += 1
+                    stack.append(neighbor)
+                    on_stack[neighbor] = True
+                    work.append([neighbor, offsets[neighbor]])
+                elif on_stack[neighbor] and order[neighbor] < lowlink[agent]:
+                    lowlink[agent] = order[neighbor]
+                continue
+
+            # All edges explored: propagate the lowlink and pop a finished component
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if lowlink[agent] < lowlink[parent]:
+                    lowlink[parent] = lowlink[agent]
+            if lowlink[agent] == order[agent]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component.append(member)
+                    if member == agent:
+                        break
+                components.append(component)
+
+    return components
@@ -6,18 +6,48 @@ then generates a visual graph of the event flow.
 """
 from __future__ import annotations
 
+import ast
+import functools
+import io
+import os
 import re
-from collections import Counter, defaultdict
-from dataclasses import dataclass
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set
+from types import MappingProxyType
+from typing import (
+    Callable, Dict, FrozenSet, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Set,
+    TextIO, Tuple
+)
 
+from .agent_graph import AgentGraph, build_agent_graph, strongly_connected_components
 
-@dataclass
-class NamespacedItem:
+# Patterns are compiled once at import time and shared by every file scan. They match
+# raw bytes: the tokens are ASCII, so source files never need a full UTF-8 decode.
+_SERVICE_BUS_RE = re.compile(
+    rb'self\.service_bus\.(?P<op>subscribe|publish)\((?P<event>[A-Za-z_]+)\.__name__'
+)
+_CLASS_RE = re.compile(rb'class\s+([A-Z][A-Za-z0-9_]*)\s*[:\(]')
+
+# File scanning is I/O bound: reads release the GIL, so oversubscribe the CPUs
+_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# try statements, including the except* form added in Python 3.11
+_TRY_NODES = tuple(getattr(ast, name) for name in ('Try', 'TryStar') if hasattr(ast, name))
+
+# DOT edge line, shared by every writer of the event flow graph
+DOT_EDGE_TEMPLATE = '    "%s" -> "%s";\n'
+
+
+class NamespacedItem(NamedTuple):
     """
     Represents an item (event or agent) with its name and namespace.
 
+    Being a tuple, hashing and equality run in C, which matters since items are used
+    as keys in every adjacency mapping. Only the ordering operators are overridden,
+    so that items sort by (namespace, name).
+
     Attributes:
         name: The class name (e.g., "UserCreated")
         namespace: The namespace/module (e.g., "user_service")
@@ -25,19 +55,122 @@ class NamespacedItem:
     name: str
     namespace: str
 
-    def __hash__(self):
-        return hash((self.name, self.namespace))
+    def __lt__(self, other):
+        if isinstance(other, NamespacedItem):
+            return (self.namespace, self.name) < (other.namespace, other.name)
+        return NotImplemented
 
-    def __eq__(self, other):
+    def __gt__(self, other):
         if isinstance(other, NamespacedItem):
-            return self.name == other.name and self.namespace == other.namespace
-        return False
+            return (self.namespace, self.name) > (other.namespace, other.name)
+        return NotImplemented
 
-    def __lt__(self, other):
+    def __le__(self, other):
         if isinstance(other, NamespacedItem):
-            return (self.namespace, self.name) < (other.namespace, other.name)
+            return (self.namespace, self.name) <= (other.namespace, other.name)
         return NotImplemented
 
+    def __ge__(self, other):
+        if isinstance(other, NamespacedItem):
+            return (self.namespace, self.name) >= (other.namespace, other.name)
+        return NotImplemented
+
+
+def _module_class_names(body: List[ast.stmt]) -> List[str]:
+    """
+    Collect the event class names defined at module level
+
+    Classes guarded by if/else or try/except blocks (version or import checks) count as
+    module-level; classes nested in functions or other classes do not. Like the regex
+    fallback, only names starting with an uppercase letter are kept.
+
+    Args:
+        body: Statements of the module, or of an if/try block at module level
+
+    Returns:
+        List of class names, in source order
+    """
+    names = []
+    for node in body:
+        if isinstance(node, ast.ClassDef):
+            if node.name[:1].isupper():
+                names.append(node.name)
+        elif isinstance(node, ast.If):
+            names.extend(_module_class_names(node.body))
+            names.extend(_module_class_names(node.orelse))
+        elif isinstance(node, _TRY_NODES):
+            names.extend(_module_class_names(node.body))
+            for handler in node.handlers:
+                names.extend(_module_class_names(handler.body))
+            names.extend(_module_class_names(node.orelse))
+            names.extend(_module_class_names(node.finalbody))
+    return names
+
+
+# Read-only adjacency with keys and values in sorted order
+SortedAdjacency = Mapping[NamespacedItem, Tuple[NamespacedItem, ...]]
+
+# Result of parsing one agent file: (agent, subscribed events, published events)
+ParsedAgent = Tuple[NamespacedItem, List[NamespacedItem], List[NamespacedItem]]
+
+
+class AgentParseCache:
+    """
+    Parsed agent files, kept across analyses so that only changed files are parsed again
+
+    Entries are keyed by file path and validated against the file's mtime and size.
+    Parse results depend on the event namespaces, so every entry is dropped when they change.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Tuple[int, int], ParsedAgent]] = {}
+        self._event_class_to_namespace: Optional[Dict[str, str]] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def prepare(self, event_class_to_namespace: Dict[str, str], file_paths: Iterable[Path]) -> None:
+        """
+        Drop the entries that can't be reused by the next analysis
+
+        Args:
+            event_class_to_namespace: Event namespaces the next analysis resolves events with
+            file_paths: Agent files of the next analysis (entries of other files are dropped)
+        """
+        if event_class_to_namespace != self._event_class_to_namespace:
+            self._entries.clear()
+            self._event_class_to_namespace = dict(event_class_to_namespace)
+            return
+
+        current = {str(file_path) for file_path in file_paths}
+        for path in [path for path in self._entries if path not in current]:
+            del self._entries[path]
+
+    def parse(self, file_path: Path, parse_file: Callable[[Path], ParsedAgent]) -> ParsedAgent:
+        """
+        Get the parse result of a file, parsing it only if it changed since it was cached
+
+        Safe to call from worker threads: each file is only ever handled by one of them.
+
+        Args:
+            file_path: Path to the agent file
+            parse_file: Parser to call on a cache miss
+
+        Returns:
+            The parse result
+        """
+        path = str(file_path)
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+
+        result = parse_file(file_path)
+        self._entries[path] = (stamp, result)
+        return result
+
 
 class EventFlowAnalyzer:
     """
@@ -45,26 +178,56 @@ class EventFlowAnalyzer:
 
     Attributes:
         agents_dir: Directory containing agent Python files
-        subscriptions: Mapping of agent -> list of subscribed events
-        publications: Mapping of agent -> list of published events
-        event_to_subscribers: Mapping of event -> list of subscriber agents
-        event_to_publishers: Mapping of event -> list of publisher agents
+        subscriptions: Read-only mapping of agent -> frozenset of subscribed events
+        publications: Read-only mapping of agent -> frozenset of published events
+        event_to_subscribers: Read-only mapping of event -> frozenset of subscriber agents
+        event_to_publishers: Read-only mapping of event -> frozenset of publisher agents
     """
 
-    def __init__(self, agents_dir: Path, events_dir: Path = None):
+    def __init__(
+            self,
+            agents_dir: Path,
+            events_dir: Path = None,
+            max_workers: Optional[int] = None
+    ):
         """
         Initialize analyzer
 
         Args:
             agents_dir: Path to directory containing agent files
             events_dir: Path to directory containing event files (optional)
+            max_workers: Number of threads reading files concurrently (optional).
+                   Defaults to four per CPU, capped at 32.
         """
         self.agents_dir = agents_dir
         self.events_dir = events_dir
-        self.subscriptions: Dict[NamespacedItem, List[NamespacedItem]] = defaultdict(list)
-        self.publications: Dict[NamespacedItem, List[NamespacedItem]] = defaultdict(list)
-        self.event_to_subscribers: Dict[NamespacedItem, List[NamespacedItem]] = defaultdict(list)
-        self.event_to_publishers: Dict[NamespacedItem, List[NamespacedItem]] = defaultdict(list)
+        self.max_workers = max_workers or _MAX_WORKERS
+        # Sets: an agent subscribing to (or publishing) the same event several times is a
+        # single edge. Private, so that only analyze() changes them and the caches derived
+        # from them below can never go stale; callers get read-only views.
+        self._subscriptions: Dict[NamespacedItem, Set[NamespacedItem]] = defaultdict(set)
+        self._publications: Dict[NamespacedItem, Set[NamespacedItem]] = defaultdict(set)
+        self._event_to_subscribers: Dict[NamespacedItem, Set[NamespacedItem]] = defaultdict(set)
+        self._event_to_publishers: Dict[NamespacedItem, Set[NamespacedItem]] = defaultdict(set)
+
+        # Node sets, kept up to date as agents are recorded
+        self._all_events: Set[NamespacedItem] = set()
+        self._all_agents: Set[NamespacedItem] = set()
+        self._all_namespaces: Set[str] = set()
+
+        # Results derived from the mappings above, reset whenever they change
+        self._read_only_views: Dict[str, Mapping[NamespacedItem, FrozenSet[NamespacedItem]]] = {}
+        self._frozen_events: Optional[FrozenSet[NamespacedItem]] = None
+        self._frozen_agents: Optional[FrozenSet[NamespacedItem]] = None
+        self._frozen_namespaces: Optional[FrozenSet[str]] = None
+        self._event_chains: Optional[List[List[NamespacedItem]]] = None
+        self._sorted_events: Optional[Tuple[NamespacedItem, ...]] = None
+        self._sorted_agents: Optional[Tuple[NamespacedItem, ...]] = None
+        self._agent_graph: Optional[AgentGraph] = None
+        self._sorted_edges: Optional[Tuple[Tuple[str, str], ...]] = None
+        self._dot_edges: Optional[str] = None
+        self._sorted_event_to_subscribers: Optional[SortedAdjacency] = None
+        self._sorted_publications: Optional[SortedAdjacency] = None
 
         # Build mapping of event class names to their directory namespaces
         self.event_class_to_namespace: Dict[str, str] = {}
@@ -79,140 +242,424 @@ class EventFlowAnalyzer:
             events/user_service/UserCreated.py -> maps "UserCreated" to "user_service"
             events/order_service/OrderPlaced.py -> maps "OrderPlaced" to "order_service"
         """
-        # Pattern to extract class names from Python files
-        class_pattern = re.compile(r'class\s+([A-Z][A-Za-z0-9_]*)\s*[:\(]')
-
-        for namespace_dir in self.events_dir.iterdir():
-            if not namespace_dir.is_dir() or namespace_dir.name.startswith('__'):
-                continue
+        # os.scandir exposes the entry type from the directory listing itself,
+        # which saves a stat() per entry compared to Path.iterdir() + is_dir()
+        event_files = []
+        namespaces = []
+        with os.scandir(self.events_dir) as namespace_entries:
+            for namespace_entry in namespace_entries:
+                if not namespace_entry.is_dir() or namespace_entry.name.startswith('__'):
+                    continue
 
-            namespace = namespace_dir.name
+                # Interned: every event and agent of the namespace shares one string object
+                namespace = sys.intern(namespace_entry.name)
+
+                # Collect all Python files in this namespace directory
+                with os.scandir(namespace_entry.path) as file_entries:
+                    for file_entry in file_entries:
+                        name = file_entry.name
+                        if (not name.endswith('.py') or name.startswith('__')
+                                or not file_entry.is_file()):
+                            continue
+                        event_files.append(Path(file_entry.path))
+                        namespaces.append(namespace)
+
+        # Files are independent: read them concurrently, then merge in discovery order
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            class_names_per_file = executor.map(self._extract_class_names, event_files)
+            for namespace, class_names in zip(namespaces, class_names_per_file):
+                for class_name in class_names:
+                    self.event_class_to_namespace[sys.intern(class_name)] = namespace
+
+    @staticmethod
+    def _extract_class_names(event_file: Path) -> List[str]:
+        """
+        Extract the names of the classes defined in an event file
 
-            # Scan all Python files in this namespace directory
-            for event_file in namespace_dir.glob("*.py"):
-                if event_file.name.startswith("__"):
-                    continue
+        Args:
+            event_file: Path to the event file
 
-                # noinspection PyUnusedLocal,PyBroadException
-                try:
-                    content = event_file.read_text()
-                    # Find all class definitions in the file
-                    for match in class_pattern.finditer(content):
-                        class_name = match.group(1)
-                        self.event_class_to_namespace[class_name] = namespace
-                except Exception as e:
-                    # Skip files that can't be read
-                    pass
+        Returns:
+            List of class names, empty if the file can't be read
+        """
+        # noinspection PyBroadException
+        try:
+            content = event_file.read_bytes()
+        except Exception:
+            # Skip files that can't be read
+            return []
 
-    def analyze(self) -> None:
-        """Analyze all agent files in the agents directory"""
-        agent_files = list(self.agents_dir.glob("*.py"))
+        # A substring test is far cheaper than parsing, and rules out most non-event files
+        if b'class' not in content:
+            return []
 
-        for agent_file in agent_files:
-            if agent_file.name.startswith("__"):
-                continue
+        # The parser is exact (multi-line signatures, decorators, no matches inside
+        # strings); the regex only serves files that are not valid Python
+        try:
+            tree = ast.parse(content, filename=str(event_file))
+        except (SyntaxError, ValueError):
+            return [match.group(1).decode('ascii') for match in _CLASS_RE.finditer(content)]
+        return _module_class_names(tree.body)
 
-            agent_name = agent_file.stem
-            self._analyze_file(agent_file, agent_name)
+    def analyze(self, parse_cache: Optional[AgentParseCache] = None) -> None:
+        """
+        Analyze all agent files in the agents directory
 
-    def _analyze_file(self, file_path: Path, agent_name: str) -> None:
+        Args:
+            parse_cache: Parse results of a previous analysis (optional). Unchanged files
+                   are taken from it instead of being read again, and it is updated in place.
         """
-        Analyze a single agent file to extract event patterns
+        # Listed with os.scandir, like the events directory: the entry type comes from
+        # the listing, and a directory named *.py is not mistaken for an agent
+        with os.scandir(self.agents_dir) as entries:
+            agent_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.endswith('.py') and not entry.name.startswith('__')
+                and entry.is_file()
+            ]
+
+        parse = self._parse_file
+        if parse_cache is not None:
+            parse_cache.prepare(self.event_class_to_namespace, agent_files)
+            parse = functools.partial(parse_cache.parse, parse_file=self._parse_file)
+
+        # Parse files concurrently, but merge the results in this thread so the
+        # shared mappings never need locking
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for agent_item, subscribed, published in executor.map(parse, agent_files):
+                self._record_agent(agent_item, subscribed, published)
+
+        self._invalidate_caches()
+
+    def _invalidate_caches(self) -> None:
+        """Drop results derived from the adjacency mappings after they have changed"""
+        self._read_only_views = {}
+        self._frozen_events = None
+        self._frozen_agents = None
+        self._frozen_namespaces = None
+        self._event_chains = None
+        self._sorted_events = None
+        self._sorted_agents = None
+        self._agent_graph = None
+        self._sorted_edges = None
+        self._dot_edges = None
+        self._sorted_event_to_subscribers = None
+        self._sorted_publications = None
+
+    def _parse_file(self, file_path: Path) -> ParsedAgent:
+        """
+        Parse a single agent file to extract event patterns
+
+        Only reads shared state, so it is safe to run from worker threads.
 
         Args:
             file_path: Path to the agent file
-            agent_name: Name of the agent
+
+        Returns:
+            Tuple of (agent, subscribed events, published events)
         """
-        content = file_path.read_text()
+        content = file_path.read_bytes()
+        agent_name = sys.intern(file_path.stem)
 
-        # First pass: collect published events to determine agent namespace
+        # Files that never mention the service bus (including binary files) can't hold
+        # any subscription or publication, so skip the regex pass over them entirely
+        if b'service_bus' not in content:
+            return NamespacedItem(name=agent_name, namespace='default'), [], []
+
+        # Single pass over the file: buffer both kinds of references, since the
+        # agent namespace must be known (from publications) before recording them
         published_events = []
-        publish_pattern = r'self\.service_bus\.publish\(([A-Za-z_]+)\.__name__'
-        for match in re.finditer(publish_pattern, content):
-            event_class_name = match.group(1)
-            event_namespace = self.event_class_to_namespace.get(event_class_name, 'default')
-            published_events.append((event_class_name, event_namespace))
+        subscribed_events = []
+        namespace_of = self.event_class_to_namespace.get
+        for match in _SERVICE_BUS_RE.finditer(content):
+            # Interned like the namespace and class keys, so every reference to an event
+            # shares one name object and comparisons short-circuit on identity
+            event_class_name = sys.intern(match.group('event').decode('ascii'))
+            event_namespace = namespace_of(event_class_name, 'default')
+            event_item = NamespacedItem(name=event_class_name, namespace=event_namespace)
+            if match.group('op') == b'publish':
+                published_events.append(event_item)
+            else:
+                subscribed_events.append(event_item)
 
         # Determine agent namespace from most common published event namespace
-        # (excluding 'default' to avoid contamination)
-        agent_namespace = 'default'
-        if published_events:
-            namespace_counts = Counter(ns for _, ns in published_events if ns != 'default')
-            if namespace_counts:
-                agent_namespace = namespace_counts.most_common(1)[0][0]
+        # (excluding 'default' to avoid contamination); ties go to the first one seen
+        namespace_counts: Dict[str, int] = {}
+        for event_item in published_events:
+            if event_item.namespace != 'default':
+                namespace = event_item.namespace
+                namespace_counts[namespace] = namespace_counts.get(namespace, 0) + 1
+        if namespace_counts:
+            agent_namespace = max(namespace_counts, key=namespace_counts.__getitem__)
+        else:
+            agent_namespace = 'default'
 
         agent_item = NamespacedItem(name=agent_name, namespace=agent_namespace)
+        return agent_item, subscribed_events, published_events
+
+    def _record_agent(
+            self,
+            agent_item: NamespacedItem,
+            subscribed_events: List[NamespacedItem],
+            published_events: List[NamespacedItem]
+    ) -> None:
+        """
+        Merge the events of a parsed agent into the adjacency mappings
 
-        # Find subscriptions: self.service_bus.subscribe(EventName.__name__, ...)
-        subscribe_pattern = r'self\.service_bus\.subscribe\(([A-Za-z_]+)\.__name__'
-        for match in re.finditer(subscribe_pattern, content):
-            event_class_name = match.group(1)
-            event_namespace = self.event_class_to_namespace.get(event_class_name, 'default')
-            event_item = NamespacedItem(name=event_class_name, namespace=event_namespace)
+        Args:
+            agent_item: The parsed agent
+            subscribed_events: Events the agent subscribes to
+            published_events: Events the agent publishes
+        """
+        if subscribed_events:
+            add_subscription = self._subscriptions[agent_item].add
+            event_to_subscribers = self._event_to_subscribers
+            for event_item in subscribed_events:
+                add_subscription(event_item)
+                event_to_subscribers[event_item].add(agent_item)
 
-            self.subscriptions[agent_item].append(event_item)
-            self.event_to_subscribers[event_item].append(agent_item)
+        if published_events:
+            add_publication = self._publications[agent_item].add
+            event_to_publishers = self._event_to_publishers
+            for event_item in published_events:
+                add_publication(event_item)
+                event_to_publishers[event_item].add(agent_item)
+
+        if subscribed_events or published_events:
+            self._all_agents.add(agent_item)
+            self._all_namespaces.add(agent_item.namespace)
+            for events in (subscribed_events, published_events):
+                self._all_events.update(events)
+                self._all_namespaces.update(event_item.namespace for event_item in events)
+
+    def _read_only_view(
+            self,
+            name: str,
+            mapping: Dict[NamespacedItem, Set[NamespacedItem]]
+    ) -> Mapping[NamespacedItem, FrozenSet[NamespacedItem]]:
+        """
+        Get a read-only snapshot of an adjacency mapping, built once per analysis
 
-        # Add publications (already collected above)
-        for event_class_name, event_namespace in published_events:
-            event_item = NamespacedItem(name=event_class_name, namespace=event_namespace)
-            self.publications[agent_item].append(event_item)
-            self.event_to_publishers[event_item].append(agent_item)
+        Args:
+            name: Cache key of the view
+            mapping: The private adjacency mapping
 
-    def get_all_events(self) -> Set[NamespacedItem]:
+        Returns:
+            Mapping proxy whose values are frozensets
+        """
+        view = self._read_only_views.get(name)
+        if view is None:
+            view = MappingProxyType({key: frozenset(values) for key, values in mapping.items()})
+            self._read_only_views[name] = view
+        return view
+
+    @property
+    def subscriptions(self) -> Mapping[NamespacedItem, FrozenSet[NamespacedItem]]:
+        """Read-only mapping of agent -> subscribed events"""
+        return self._read_only_view('subscriptions', self._subscriptions)
+
+    @property
+    def publications(self) -> Mapping[NamespacedItem, FrozenSet[NamespacedItem]]:
+        """Read-only mapping of agent -> published events"""
+        return self._read_only_view('publications', self._publications)
+
+    @property
+    def event_to_subscribers(self) -> Mapping[NamespacedItem, FrozenSet[NamespacedItem]]:
+        """Read-only mapping of event -> subscriber agents"""
+        return self._read_only_view('event_to_subscribers', self._event_to_subscribers)
+
+    @property
+    def event_to_publishers(self) -> Mapping[NamespacedItem, FrozenSet[NamespacedItem]]:
+        """Read-only mapping of event -> publisher agents"""
+        return self._read_only_view('event_to_publishers', self._event_to_publishers)
+
+    def get_all_events(self) -> FrozenSet[NamespacedItem]:
         """
         Get all unique events across all agents
 
+        Maintained while files are analyzed and frozen once per analysis.
+
         Returns:
-            Set of NamespacedItem objects representing events
+            Frozenset of NamespacedItem objects representing events
         """
-        events = set()
-        events.update(self.event_to_subscribers.keys())
-        events.update(self.event_to_publishers.keys())
-        return events
+        if self._frozen_events is None:
+            self._frozen_events = frozenset(self._all_events)
+        return self._frozen_events
 
-    def get_all_agents(self) -> Set[NamespacedItem]:
+    def get_all_agents(self) -> FrozenSet[NamespacedItem]:
         """
         Get all unique agents
 
+        Maintained while files are analyzed and frozen once per analysis.
+
         Returns:
-            Set of NamespacedItem objects representing agents
+            Frozenset of NamespacedItem objects representing agents
         """
-        return set(self.subscriptions.keys()) | set(self.publications.keys())
+        if self._frozen_agents is None:
+            self._frozen_agents = frozenset(self._all_agents)
+        return self._frozen_agents
 
-    def get_all_namespaces(self) -> Set[str]:
+    def get_all_namespaces(self) -> FrozenSet[str]:
         """
         Get all unique namespaces from both agents and events
 
+        Maintained while files are analyzed and frozen once per analysis.
+
+        Returns:
+            Frozenset of namespace strings
+        """
+        if self._frozen_namespaces is None:
+            self._frozen_namespaces = frozenset(self._all_namespaces)
+        return self._frozen_namespaces
+
+    def get_sorted_events(self) -> Tuple[NamespacedItem, ...]:
+        """
+        Get all events in sorted order, sorting them only once per analysis
+
+        Shared by every DOT writer, so a scan rendering several graphs sorts once.
+
+        Returns:
+            Tuple of NamespacedItem objects representing events
+        """
+        if self._sorted_events is None:
+            self._sorted_events = tuple(sorted(self.get_all_events()))
+        return self._sorted_events
+
+    def get_sorted_agents(self) -> Tuple[NamespacedItem, ...]:
+        """
+        Get all agents in sorted order, sorting them only once per analysis
+
+        Shared by every DOT writer, so a scan rendering several graphs sorts once.
+
         Returns:
-            Set of namespace strings
+            Tuple of NamespacedItem objects representing agents
         """
-        namespaces = set()
+        if self._sorted_agents is None:
+            self._sorted_agents = tuple(sorted(self.get_all_agents()))
+        return self._sorted_agents
 
-        # Collect event namespaces
-        for event in self.get_all_events():
-            namespaces.add(event.namespace)
+    def get_sorted_edges(self) -> Tuple[Tuple[str, str], ...]:
+        """
+        Get the edges of the event flow graph as (source, target) name pairs, in DOT order
 
-        # Collect agent namespaces
-        for agent in self.get_all_agents():
-            namespaces.add(agent.namespace)
+        Subscription edges (event -> subscriber) come first, then publication edges
+        (agent -> event), each sorted by source then target. Sorted once per analysis
+        and shared by every DOT writer.
+
+        Returns:
+            Tuple of (source name, target name) pairs
+        """
+        if self._sorted_edges is None:
+            self._sorted_edges = tuple(
+                [(event.name, subscriber.name)
+                 for event, subscribers in self.get_sorted_event_to_subscribers().items()
+                 for subscriber in subscribers]
+                + [(agent.name, event.name)
+                   for agent, publications in self.get_sorted_publications().items()
+                   for event in publications]
+            )
+        return self._sorted_edges
+
+    def get_dot_edges(self) -> str:
+        """
+        Get the DOT statements of all edges, in get_sorted_edges() order
 
-        return namespaces
+        Edges are the bulk of every graph and identical in all of them, so they are
+        formatted once per analysis and written as one block by every DOT writer.
+
+        Returns:
+            One '"source" -> "target";' line per edge, each newline-terminated
+        """
+        if self._dot_edges is None:
+            self._dot_edges = ''.join(
+                [DOT_EDGE_TEMPLATE % edge for edge in self.get_sorted_edges()]
+            )
+        return self._dot_edges
+
+    def get_sorted_event_to_subscribers(self) -> SortedAdjacency:
+        """
+        Get the event -> subscribers mapping with events and subscribers in sorted order
+
+        Sorted once per analysis, and read-only so the shared result can't be altered.
+
+        Returns:
+            Mapping iterating over events in sorted order, each mapped to a sorted tuple
+            of subscribers
+        """
+        if self._sorted_event_to_subscribers is None:
+            self._sorted_event_to_subscribers = MappingProxyType({
+                event: tuple(sorted(subscribers))
+                for event, subscribers in sorted(self._event_to_subscribers.items())
+            })
+        return self._sorted_event_to_subscribers
+
+    def get_sorted_publications(self) -> SortedAdjacency:
+        """
+        Get the agent -> published events mapping with agents and events in sorted order
+
+        Sorted once per analysis, and read-only so the shared result can't be altered.
+
+        Returns:
+            Mapping iterating over agents in sorted order, each mapped to a sorted tuple
+            of events
+        """
+        if self._sorted_publications is None:
+            self._sorted_publications = MappingProxyType({
+                agent: tuple(sorted(publications))
+                for agent, publications in sorted(self._publications.items())
+            })
+        return self._sorted_publications
+
+    def get_agent_graph(self) -> AgentGraph:
+        """
+        Get the agent -> agent graph as integer-indexed CSR arrays
+
+        Built once per analysis, for consumers that traverse the graph repeatedly.
+
+        Returns:
+            AgentGraph where agent A reaches agent B if B subscribes to an event A publishes
+        """
+        if self._agent_graph is None:
+            self._agent_graph = build_agent_graph(
+                self.get_all_agents(), self._publications, self._event_to_subscribers
+            )
+        return self._agent_graph
+
+    def strongly_connected_components(self) -> List[List[NamespacedItem]]:
+        """
+        Find groups of agents that form circular dependencies
+
+        Returns:
+            Strongly connected components of the agent graph with more than one agent,
+            each as a sorted list of NamespacedItem
+        """
+        graph = self.get_agent_graph()
+        return [
+            [graph.agents[agent_id] for agent_id in sorted(component)]
+            for component in strongly_connected_components(graph)
+            if len(component) > 1
+        ]
 
     def get_event_chains(self) -> List[List[NamespacedItem]]:
         """
         Build event chains (sequences of events)
 
+        The chains only depend on the analysis results, so they are computed once
+        and reused until the next call to analyze().
+
         Returns:
             List of event chains, where each chain is a list of NamespacedItem
         """
+        if self._event_chains is not None:
+            return [list(chain) for chain in self._event_chains]
+
         chains = []
         visited = set()
 
         # Find entry point events (published but never consumed by agents)
         entry_events = []
-        for event in self.event_to_publishers.keys():
-            if event not in self.event_to_subscribers:
+        for event in self._event_to_publishers.keys():
+            if event not in self._event_to_subscribers:
                 entry_events.append(event)
 
         # Build chains starting from entry events
@@ -221,11 +668,15 @@ class EventFlowAnalyzer:
             if chain:
                 chains.append(chain)
 
-        return chains
+        self._event_chains = chains
+        return [list(chain) for chain in chains]
 
     def _build_chain(self, event: NamespacedItem, visited: Set[NamespacedItem]) -> List[NamespacedItem]:
         """
-        Recursively build an event chain
+        Build an event chain with an iterative depth-first traversal
+
+        Events are listed in the same pre-order a recursive traversal would produce,
+        without being bounded by the interpreter recursion limit.
 
         Args:
             event: Starting event (NamespacedItem)
@@ -240,19 +691,34 @@ class EventFlowAnalyzer:
         visited.add(event)
         chain = [event]
 
-        # Find agents that subscribe to this event
-        subscribers = self.event_to_subscribers.get(event, [])
-
-        # For each subscriber, find what events they publish
-        for subscriber in subscribers:
-            published_events = self.publications.get(subscriber, [])
-            for published_event in published_events:
-                sub_chain = self._build_chain(published_event, visited)
-                if sub_chain:
-                    chain.extend(sub_chain)
+        # Each stack entry lazily yields the events published by the subscribers of an event
+        stack = [self._iter_next_events(event)]
+        while stack:
+            for next_event in stack[-1]:
+                if next_event not in visited:
+                    visited.add(next_event)
+                    chain.append(next_event)
+                    stack.append(self._iter_next_events(next_event))
+                    break
+            else:
+                stack.pop()
 
         return chain
 
+    def _iter_next_events(self, event: NamespacedItem) -> Iterator[NamespacedItem]:
+        """
+        Iterate over the events published by the agents subscribing to an event
+
+        Args:
+            event: The event (NamespacedItem)
+
+        Yields:
+            Events that directly follow the given event in the flow, in a stable order
+        """
+        sorted_publications = self.get_sorted_publications()
+        for subscriber in self.get_sorted_event_to_subscribers().get(event, ()):
+            yield from sorted_publications.get(subscriber, ())
+
     def generate_graphviz(self) -> str:
         """
         Generate Graphviz DOT format representation
@@ -260,38 +726,45 @@ class EventFlowAnalyzer:
         Returns:
             DOT format string
         """
-        lines = ['digraph EventFlow {',
-                 '    rankdir=LR;',
-                 '    node [shape=box];',
-                 '']
+        buffer = io.StringIO()
+        self.write_graphviz(buffer)
+        return buffer.getvalue()
+
+    def write_graphviz(self, fp: TextIO) -> None:
+        """
+        Write the Graphviz DOT format representation to a text stream
 
-        events = self.get_all_events()
-        agents = set(self.subscriptions.keys()) | set(self.publications.keys())
+        Lines are written as they are produced, so writing to an open file never
+        holds the whole document in memory.
+
+        Args:
+            fp: Writable text stream (e.g., an open file or io.StringIO)
+        """
+        write = fp.write
+        write('digraph EventFlow {\n'
+              '    rankdir=LR;\n'
+              '    node [shape=box];\n'
+              '\n')
 
         # Define event nodes
-        lines.append('    // Events')
-        for event in sorted(events):
-            lines.append(f'    "{event.name}" [style=filled, fillcolor=lightblue, shape=ellipse, class="namespace-{event.namespace}"];')
+        write('    // Events\n')
+        for event in self.get_sorted_events():
+            write(f'    "{event.name}" [style=filled, fillcolor=lightblue, shape=ellipse, '
+                  f'class="namespace-{event.namespace}"];\n')
 
-        lines.append('')
-        lines.append('    // Agents')
-        for agent in sorted(agents):
-            lines.append(f'    "{agent.name}" [style=filled, fillcolor=lightyellow, class="namespace-{agent.namespace}"];')
+        write('\n')
+        write('    // Agents\n')
+        for agent in self.get_sorted_agents():
+            write(f'    "{agent.name}" [style=filled, fillcolor=lightyellow, '
+                  f'class="namespace-{agent.namespace}"];\n')
 
-        lines.append('')
-        lines.append('    // Event Flow')
+        write('\n')
+        write('    // Event Flow\n')
 
         # Add edges
-        for event, subscribers in sorted(self.event_to_subscribers.items()):
-            for subscriber in subscribers:
-                lines.append(f'    "{event.name}" -> "{subscriber.name}";')
-
-        for agent, publications in sorted(self.publications.items()):
-            for event in publications:
-                lines.append(f'    "{agent.name}" -> "{event.name}";')
+        write(self.get_dot_edges())
 
-        lines.append('}')
-        return '\n'.join(lines)
+        write('}')
 
     def print_summary(self) -> None:
         """Print a text summary of the event flow to console"""
@@ -300,8 +773,8 @@ class EventFlowAnalyzer:
         print("=" * 80)
         print()
 
-        events = self.get_all_events()
-        agents = set(self.subscriptions.keys()) | set(self.publications.keys())
+        events = self.get_sorted_events()
+        agents = self.get_sorted_agents()
 
         print(f"Total Events: {len(events)}")
         print(f"Total Agents: {len(agents)}")
@@ -311,9 +784,9 @@ class EventFlowAnalyzer:
         print("EVENTS → SUBSCRIBERS → PUBLISHERS")
         print("-" * 80)
 
-        for event in sorted(events):
-            subscribers = self.event_to_subscribers.get(event, [])
-            publishers = self.event_to_publishers.get(event, [])
+        for event in events:
+            subscribers = self._event_to_subscribers.get(event, ())
+            publishers = self._event_to_publishers.get(event, ())
 
             print(f"\n📌 {event.name} (namespace: {event.namespace})")
 
@@ -332,9 +805,9 @@ class EventFlowAnalyzer:
         print("AGENT EVENT MATRIX")
         print("-" * 80)
 
-        for agent in sorted(agents):
-            subscribed = self.subscriptions.get(agent, [])
-            published = self.publications.get(agent, [])
+        for agent in agents:
+            subscribed = self._subscriptions.get(agent, ())
+            published = self._publications.get(agent, ())
 
             print(f"\n🤖 {agent.name} (namespace: {agent.namespace})")
             if subscribed:
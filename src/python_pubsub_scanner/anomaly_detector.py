@@ -8,13 +8,91 @@ This module provides tools to detect potential issues in event-driven architectu
 """
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import Dict, List, TYPE_CHECKING
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, TypedDict, TYPE_CHECKING
+
+from .agent_graph import AgentGraph, strongly_connected_components
 
 if TYPE_CHECKING:
     from .analyze_event_flow import EventFlowAnalyzer, NamespacedItem
 
 
+class OrphanedEvent(TypedDict):
+    """An event that is never published or never subscribed."""
+    event: str
+    namespace: str
+    type: str  # 'never_published' or 'never_subscribed'
+    severity: str
+    message: str
+
+
+class CycleStep(TypedDict):
+    """One agent of a cycle, with the events it publishes to the next agent."""
+    agent: str
+    namespace: str
+    publishes: List[str]
+
+
+class Cycle(TypedDict):
+    """A circular dependency between agents."""
+    cycle: List[str]
+    path: List[CycleStep]
+    severity: str
+    message: str
+
+
+class IsolatedAgent(TypedDict):
+    """An agent with neither subscriptions nor publications."""
+    agent: str
+    namespace: str
+    severity: str
+    message: str
+
+
+class AnomalyReport(TypedDict):
+    """All detected anomalies, as returned by AnomalyDetector.detect_all()."""
+    orphaned_events: List[OrphanedEvent]
+    cycles: List[Cycle]
+    isolated_agents: List[IsolatedAgent]
+
+
+class AnomalySummary(TypedDict):
+    """Anomaly counts, as returned by AnomalyDetector.get_anomaly_summary()."""
+    orphaned_events_count: int
+    cycles_count: int
+    isolated_agents_count: int
+    total_anomalies: int
+
+
+@dataclass
+class _AnomalyResult:
+    """One detection pass: the anomaly lists and their counts."""
+    orphaned_events: List[OrphanedEvent]
+    cycles: List[Cycle]
+    isolated_agents: List[IsolatedAgent]
+    counts: AnomalySummary = field(init=False)
+
+    def __post_init__(self):
+        orphaned_count = len(self.orphaned_events)
+        cycles_count = len(self.cycles)
+        isolated_count = len(self.isolated_agents)
+        self.counts = {
+            'orphaned_events_count': orphaned_count,
+            'cycles_count': cycles_count,
+            'isolated_agents_count': isolated_count,
+            'total_anomalies': orphaned_count + cycles_count + isolated_count,
+        }
+
+
+class _Activity(NamedTuple):
+    """Events and agents with at least one connection, each one tested by a single set lookup."""
+    events_with_publishers: FrozenSet[NamespacedItem]
+    events_with_subscribers: FrozenSet[NamespacedItem]
+    active_publishers: FrozenSet[NamespacedItem]
+    active_subscribers: FrozenSet[NamespacedItem]
+
+
 class AnomalyDetector:
     """
     Detects anomalies in event flow architecture.
@@ -31,24 +109,80 @@ class AnomalyDetector:
             analyzer: An EventFlowAnalyzer instance with completed analysis.
         """
         self.analyzer = analyzer
+        self._result: Optional[_AnomalyResult] = None
+        self._activity: Optional[_Activity] = None
+
+    def invalidate(self) -> None:
+        """
+        Discard the cached detection results and connection sets.
+
+        Call this after the analyzer has been modified (e.g., re-analyzed) so the
+        next detection runs against the new data.
+        """
+        self._result = None
+        self._activity = None
 
-    def detect_all(self) -> Dict[str, List[Dict[str, str]]]:
+    def _get_activity(self) -> _Activity:
+        """
+        Get the sets of connected events and agents, computed once per analysis.
+
+        Empty adjacency entries are filtered out here, so the detectors only need
+        a membership test per event or agent.
+
+        Returns:
+            The _Activity sets.
+        """
+        if self._activity is None:
+            analyzer = self.analyzer
+            self._activity = _Activity(
+                events_with_publishers=frozenset(
+                    e for e, p in analyzer.event_to_publishers.items() if p
+                ),
+                events_with_subscribers=frozenset(
+                    e for e, s in analyzer.event_to_subscribers.items() if s
+                ),
+                active_publishers=frozenset(a for a, e in analyzer.publications.items() if e),
+                active_subscribers=frozenset(a for a, e in analyzer.subscriptions.items() if e),
+            )
+        return self._activity
+
+    def detect_all(self) -> AnomalyReport:
         """
         Run all anomaly detections and return a comprehensive report.
 
+        The detections run once; later calls (including get_anomaly_summary) reuse
+        their results until invalidate() is called. Each call returns new lists, so
+        callers may alter the report without affecting later ones.
+
         Returns:
             A dictionary with keys:
             - 'orphaned_events': List of events that are never published or never subscribed
             - 'cycles': List of detected circular dependencies
             - 'isolated_agents': List of agents with no connections
         """
+        result = self._get_result()
         return {
-            'orphaned_events': self.detect_orphaned_events(),
-            'cycles': self.detect_cycles(),
-            'isolated_agents': self.detect_isolated_agents(),
+            'orphaned_events': list(result.orphaned_events),
+            'cycles': list(result.cycles),
+            'isolated_agents': list(result.isolated_agents),
         }
 
-    def detect_orphaned_events(self) -> List[Dict[str, str]]:
+    def _get_result(self) -> _AnomalyResult:
+        """
+        Get the result of the detection pass, running it on first use.
+
+        Returns:
+            The cached _AnomalyResult.
+        """
+        if self._result is None:
+            self._result = _AnomalyResult(
+                orphaned_events=self.detect_orphaned_events(),
+                cycles=self.detect_cycles(),
+                isolated_agents=self.detect_isolated_agents(),
+            )
+        return self._result
+
+    def detect_orphaned_events(self) -> List[OrphanedEvent]:
         """
         Detect events that are never published or never subscribed.
 
@@ -63,25 +197,30 @@ class AnomalyDetector:
             - 'type': 'never_published' or 'never_subscribed'
             - 'severity': 'warning' or 'info'
         """
-        orphaned = []
+        orphaned: List[OrphanedEvent] = []
         all_events = self.analyzer.get_all_events()
+        activity = self._get_activity()
+        with_publishers = activity.events_with_publishers
+        with_subscribers = activity.events_with_subscribers
+        append = orphaned.append
 
+        # Single pass: an event yields zero, one or two records
         for event in all_events:
-            # Check if event is never published
-            publishers = self.analyzer.event_to_publishers.get(event, [])
-            if not publishers:
-                orphaned.append({
+            never_published = event not in with_publishers
+            never_subscribed = event not in with_subscribers
+            if not (never_published or never_subscribed):
+                continue
+
+            if never_published:
+                append({
                     'event': event.name,
                     'namespace': event.namespace,
                     'type': 'never_published',
                     'severity': 'warning',
                     'message': f"Event '{event.name}' is never published by any agent"
                 })
-
-            # Check if event is never subscribed
-            subscribers = self.analyzer.event_to_subscribers.get(event, [])
-            if not subscribers:
-                orphaned.append({
+            if never_subscribed:
+                append({
                     'event': event.name,
                     'namespace': event.namespace,
                     'type': 'never_subscribed',
@@ -91,94 +230,91 @@ class AnomalyDetector:
 
         return orphaned
 
-    def detect_cycles(self) -> List[Dict[str, any]]:
+    def detect_cycles(self) -> List[Cycle]:
         """
         Detect circular dependencies in the event flow.
 
         A cycle exists when Agent A publishes Event X, which is consumed by Agent B,
         which publishes Event Y, which is consumed by Agent A (directly or indirectly).
 
+        Agents are grouped into strongly connected components (iterative Tarjan over the
+        analyzer's cached integer-indexed agent graph, linear in its size); every group
+        of two or more agents is reported once, through a shortest cycle starting at its
+        first agent.
+
         Returns:
             A list of dictionaries with keys:
             - 'cycle': List of agent names forming the cycle
             - 'path': Detailed path showing agents and events
             - 'severity': 'warning'
         """
-        cycles = []
-        all_agents = self.analyzer.get_all_agents()
-
-        # Build agent-to-agent graph
-        # agent_graph[A] = set of agents that A can reach via published events
-        agent_graph = defaultdict(set)
-
-        for agent, published_events in self.analyzer.publications.items():
-            for event in published_events:
-                # Find who subscribes to this event
-                subscribers = self.analyzer.event_to_subscribers.get(event, [])
-                for subscriber in subscribers:
-                    if subscriber != agent:  # Avoid self-loops
-                        agent_graph[agent].add(subscriber)
-
-        # DFS to detect cycles
-        visited = set()
-        rec_stack = set()
-        path = []
-
-        # noinspection PyShadowingNames
-        def dfs(agent: NamespacedItem) -> bool:
-            """DFS helper to detect cycles."""
-            visited.add(agent)
-            rec_stack.add(agent)
-            path.append(agent)
-
-            for neighbor in agent_graph.get(agent, []):
-                if neighbor not in visited:
-                    if dfs(neighbor):
-                        return True
-                elif neighbor in rec_stack:
-                    # Found a cycle
-                    cycle_start = path.index(neighbor)
-                    cycle_agents = path[cycle_start:]
-
-                    # Build detailed path with events
-                    detailed_path = []
-                    for i in range(len(cycle_agents)):
-                        current = cycle_agents[i]
-                        next_agent = cycle_agents[(i + 1) % len(cycle_agents)]
-
-                        # Find connecting event
-                        connecting_events = []
-                        for event in self.analyzer.publications.get(current, []):
-                            if next_agent in self.analyzer.event_to_subscribers.get(event, []):
-                                connecting_events.append(event.name)
-
-                        detailed_path.append({
-                            'agent': current.name,
-                            'namespace': current.namespace,
-                            'publishes': connecting_events
-                        })
-
-                    cycles.append({
-                        'cycle': [a.name for a in cycle_agents],
-                        'path': detailed_path,
-                        'severity': 'warning',
-                        'message': f"Circular dependency detected: {' -> '.join(a.name for a in cycle_agents)} -> {cycle_agents[0].name}"
-                    })
-                    return True
-
-            path.pop()
-            rec_stack.remove(agent)
-            return False
-
-        # Run DFS from each unvisited agent
-        for agent in all_agents:
-            if agent not in visited:
-                path = []
-                dfs(agent)
+        graph = self.analyzer.get_agent_graph()
+
+        cycles: List[Cycle] = []
+        for component in strongly_connected_components(graph):
+            if len(component) < 2:
+                continue
+
+            cycle_ids = self._shortest_cycle(graph, component)
+            cycle_agents = [graph.agents[agent_id] for agent_id in cycle_ids]
+
+            # Build detailed path with the events labelling each edge of the cycle
+            detailed_path: List[CycleStep] = []
+            for i, current in enumerate(cycle_agents):
+                edge = (cycle_ids[i], cycle_ids[(i + 1) % len(cycle_ids)])
+                detailed_path.append({
+                    'agent': current.name,
+                    'namespace': current.namespace,
+                    'publishes': sorted(event.name for event in graph.edge_events[edge])
+                })
+
+            cycle_names = ' -> '.join(a.name for a in cycle_agents)
+            cycles.append({
+                'cycle': [a.name for a in cycle_agents],
+                'path': detailed_path,
+                'severity': 'warning',
+                'message': f"Circular dependency detected: {cycle_names} -> {cycle_agents[0].name}"
+            })
 
         return cycles
 
-    def detect_isolated_agents(self) -> List[Dict[str, str]]:
+    @staticmethod
+    def _shortest_cycle(graph: AgentGraph, component: List[int]) -> List[int]:
+        """
+        Find a shortest cycle through the lowest agent id of a strongly connected component.
+
+        Args:
+            graph: The agent graph.
+            component: Agent ids of a strongly connected component with at least two agents.
+
+        Returns:
+            Agent ids along the cycle, starting with the lowest id of the component.
+        """
+        members = set(component)
+        start = min(component)
+        parents: Dict[int, Optional[int]] = {start: None}
+        queue = deque([start])
+
+        # Breadth-first search inside the component until an edge leads back to the start
+        while queue:
+            agent_id = queue.popleft()
+            for neighbor in graph.neighbors(agent_id):
+                if neighbor == start:
+                    cycle = []
+                    node: Optional[int] = agent_id
+                    while node is not None:
+                        cycle.append(node)
+                        node = parents[node]
+                    cycle.reverse()
+                    return cycle
+                if neighbor in members and neighbor not in parents:
+                    parents[neighbor] = agent_id
+                    queue.append(neighbor)
+
+        # Unreachable: every agent of a strongly connected component lies on a cycle
+        return [start]
+
+    def detect_isolated_agents(self) -> List[IsolatedAgent]:
         """
         Detect agents that have no connections (neither publishers nor subscribers).
 
@@ -193,24 +329,25 @@ class AnomalyDetector:
             - 'namespace': The agent namespace
             - 'severity': 'info'
         """
-        isolated = []
-        all_agents = self.analyzer.get_all_agents()
-
-        for agent in all_agents:
-            is_publisher = agent in self.analyzer.publications and len(self.analyzer.publications[agent]) > 0
-            is_subscriber = agent in self.analyzer.subscriptions and len(self.analyzer.subscriptions[agent]) > 0
-
-            if not is_publisher and not is_subscriber:
-                isolated.append({
-                    'agent': agent.name,
-                    'namespace': agent.namespace,
-                    'severity': 'info',
-                    'message': f"Agent '{agent.name}' is isolated (no subscriptions or publications)"
-                })
+        activity = self._get_activity()
+
+        # Set algebra in C instead of two membership tests per agent; sorted for a stable report
+        isolated_agents = set(self.analyzer.get_all_agents()).difference(
+            activity.active_publishers, activity.active_subscribers
+        )
+        isolated: List[IsolatedAgent] = [
+            {
+                'agent': agent.name,
+                'namespace': agent.namespace,
+                'severity': 'info',
+                'message': f"Agent '{agent.name}' is isolated (no subscriptions or publications)"
+            }
+            for agent in sorted(isolated_agents)
+        ]
 
         return isolated
 
-    def get_anomaly_summary(self) -> Dict[str, int]:
+    def get_anomaly_summary(self) -> AnomalySummary:
         """
         Get a summary count of all anomalies.
 
@@ -221,13 +358,5 @@ class AnomalyDetector:
             - 'isolated_agents_count'
             - 'total_anomalies'
         """
-        anomalies = self.detect_all()
-
-        counts = {
-            'orphaned_events_count': len(anomalies['orphaned_events']),
-            'cycles_count': len(anomalies['cycles']),
-            'isolated_agents_count': len(anomalies['isolated_agents']),
-        }
-        counts['total_anomalies'] = sum(counts.values())
-
-        return counts
+        # Counted once when the detection pass completes; copied so callers cannot alter the cache
+        return AnomalySummary(**self._get_result().counts)
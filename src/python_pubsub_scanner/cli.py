@@ -6,17 +6,13 @@ from __future__ import annotations
 import argparse
 import sys
 from pathlib import Path
+from typing import Optional
 
 from .config_helper import ConfigHelper
 from .scanner import EventFlowScanner
 
 
-def main() -> None:
-    """CLI entry point for scanner"""
-    parser = argparse.ArgumentParser(
-        description="Event Flow Scanner - Scan codebase and push graphs to API",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_EPILOG = """
 Examples:
   # Using config file (recommended - includes colors and styling)
   pubsub-scanner --config event_flow_config.yaml --one-shot
@@ -31,7 +27,22 @@ Examples:
   pubsub-scanner --agents-dir ./agents --events-dir ./events --one-shot
 
 For more information: https://github.com/venantvr-trading/Python.PubSub.Scanner
-        """
+"""
+
+# Built on first use and reused by every later main() call
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser once and return the shared instance"""
+    global _PARSER
+    if _PARSER is not None:
+        return _PARSER
+
+    parser = argparse.ArgumentParser(
+        description="Event Flow Scanner - Scan codebase and push graphs to API",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
 
     parser.add_argument(
@@ -76,7 +87,13 @@ For more information: https://github.com/venantvr-trading/Python.PubSub.Scanner
         help='Enable debug mode (show full tracebacks)'
     )
 
-    args = parser.parse_args()
+    _PARSER = parser
+    return parser
+
+
+def main() -> None:
+    """CLI entry point for scanner"""
+    args = _build_parser().parse_args()
 
     # Determine mode. Default to one-shot if no mode is specified.
     is_continuous = args.interval is not None and not args.one_shot
@@ -114,17 +131,15 @@ For more information: https://github.com/venantvr-trading/Python.PubSub.Scanner
         if is_continuous:
             scanner.run_continuous()
         else:
-            results = scanner.scan_once()
+            summary = scanner.scan_once()
+            scanner.close()
 
             # Print summary and exit
-            success_count = sum(1 for s in results.values() if s)
-            total_count = len(results)
-
             print()
-            print(f"[SCAN] Summary: {success_count}/{total_count} graphs pushed successfully")
+            print(f"[SCAN] Summary: {summary.successes}/{summary.total} graphs pushed successfully")
 
             # Exit with appropriate code
-            sys.exit(0 if success_count == total_count else 1)
+            sys.exit(0 if summary.successes == summary.total else 1)
 
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
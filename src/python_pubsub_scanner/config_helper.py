@@ -1,10 +1,31 @@
 from __future__ import annotations
 
+import copy
+import os
+import stat
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
 import yaml
 
+# libyaml's C loader when PyYAML was built with it, with the same semantics as safe_load
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=32)
+def _load_yaml(path_str: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a YAML file, memoized on its path, modification time and size.
+
+    An unchanged file is parsed only once per process (e.g. across the scans of
+    continuous mode); editing it changes the key and triggers a new parse. The
+    returned object is shared, so callers must copy it before mutating it.
+    Clear with ``_load_yaml.cache_clear()``.
+    """
+    with open(path_str, 'r') as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
 
 class ConfigHelper:
     """
@@ -51,15 +72,23 @@ class ConfigHelper:
 
     def _find_and_load(self):
         """Traverse up to find and load the configuration file."""
-        current_dir = self.start_path.parent if self.start_path.is_file() else self.start_path
-
-        while current_dir != current_dir.parent:  # Stop at filesystem root
-            config_file = current_dir / self.config_filename
-            if config_file.is_file() and ".venv" not in str(current_dir):
-                self.project_root = current_dir
-                self.config_path = config_file
-                break
-            current_dir = current_dir.parent
+        # Plain string paths and one stat per level: no Path allocation per ancestor
+        start = os.fspath(self.start_path)
+        current_dir = os.path.dirname(start) if os.path.isfile(start) else start
+        parent_dir = os.path.dirname(current_dir)
+
+        while current_dir != parent_dir:  # Stop at filesystem root
+            if ".venv" not in current_dir:
+                candidate = os.path.join(current_dir, self.config_filename)
+                try:
+                    found = stat.S_ISREG(os.stat(candidate).st_mode)
+                except OSError:
+                    found = False
+                if found:
+                    self.project_root = Path(current_dir)
+                    self.config_path = Path(candidate)
+                    break
+            current_dir, parent_dir = parent_dir, os.path.dirname(parent_dir)
 
         if not self.project_root or not self.config_path:
             raise FileNotFoundError(
@@ -67,8 +96,10 @@ class ConfigHelper:
             )
 
         try:
-            with open(self.config_path, 'r') as f:
-                self.config = yaml.safe_load(f)
+            stat_result = os.stat(self.config_path)
+            self.config = copy.deepcopy(
+                _load_yaml(str(self.config_path), stat_result.st_mtime_ns, stat_result.st_size)
+            )
             if not isinstance(self.config, dict):
                 raise ValueError("Config file is not a valid dictionary.")
         except (yaml.YAMLError, ValueError) as e:
@@ -5,12 +5,24 @@ Creates hierarchical visualizations of event flow in DOT format.
 """
 from __future__ import annotations
 
+import io
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TextIO, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .analyze_event_flow import EventFlowAnalyzer
 
+# Static document header
+_HEADER = (
+    'digraph EventFlow {\n'
+    '    rankdir=TB;\n'
+    '    splines=ortho;\n'
+    '    node [shape=box, style="filled,rounded", fontname="Arial", fontsize=10, '
+    'color="#cccccc"];\n'
+    '    edge [arrowsize=0.8, color="#999999"];\n'
+    '\n'
+)
+
 
 def generate_hierarchical_tree(analyzer: EventFlowAnalyzer, output_path: str, output_format: str = "png") -> None:
     """
@@ -21,57 +33,63 @@ def generate_hierarchical_tree(analyzer: EventFlowAnalyzer, output_path: str, ou
         output_path: Path to save the output file
         output_format: Output format (only 'dot' is directly supported)
     """
-    # Create DOT content
-    lines = ['digraph EventFlow {',
-             '    rankdir=TB;',
-             '    splines=ortho;',
-             '    node [shape=box, style="filled,rounded", fontname="Arial", fontsize=10, color="#cccccc"];',
-             '    edge [arrowsize=0.8, color="#999999"];',
-             '']
-
-    # Separate events and agents
-    events = analyzer.get_all_events()
-    agents = analyzer.get_all_agents()
+    if output_format.lower() == 'dot':
+        dot_path = output_path
+    else:
+        # For other formats, save as .dot and show conversion command
+        dot_path = str(Path(output_path).with_suffix('.dot'))
 
-    # Agent color
-    agent_color = '#ffcc80'
+    # Stream straight to the file: the document is never held in memory as a whole
+    with open(dot_path, 'w') as f:
+        write_hierarchical_tree(analyzer, f)
 
-    # Add event nodes
-    lines.append('    // Events')
-    for event in sorted(events):
-        lines.append(f'    "{event.name}" [fillcolor="#e0e0e0", shape=ellipse, fontsize=10, class="namespace-{event.namespace}"];')
+    print(f"✅ DOT file saved to {dot_path}")
+    if output_format.lower() == 'dot':
+        print(f"   Generate image with: dot -Tpng {output_path} -o event_tree.png")
+    else:
+        print(f"   Convert to {output_format}: dot -T{output_format} {dot_path} -o {output_path}")
 
-    lines.append('')
-    lines.append('    // Agents')
-    for agent in sorted(agents):
-        label = agent.name.replace('_', ' ')
-        lines.append(f'    "{agent.name}" [label="{label}", fillcolor="{agent_color}", shape=box, fontsize=10, class="namespace-{agent.namespace}"];')
 
-    lines.append('')
-    lines.append('    // Edges')
+def hierarchical_tree_to_string(analyzer: EventFlowAnalyzer) -> str:
+    """
+    Generate the hierarchical tree DOT document as a string
 
-    # Add edges: event -> agent (subscription)
-    for event, subscribers in sorted(analyzer.event_to_subscribers.items()):
-        for subscriber in subscribers:
-            lines.append(f'    "{event.name}" -> "{subscriber.name}";')
+    Args:
+        analyzer: EventFlowAnalyzer instance with analysis results
 
-    # Add edges: agent -> event (publication)
-    for agent, publications in sorted(analyzer.publications.items()):
-        for event in publications:
-            lines.append(f'    "{agent.name}" -> "{event.name}";')
+    Returns:
+        DOT format string
+    """
+    buffer = io.StringIO()
+    write_hierarchical_tree(analyzer, buffer)
+    return buffer.getvalue()
 
-    lines.append('}')
 
-    # Write output
-    dot_content = '\n'.join(lines)
+def write_hierarchical_tree(analyzer: EventFlowAnalyzer, fp: TextIO) -> None:
+    """Write the hierarchical tree DOT document to a text stream, such as an open file"""
+    write = fp.write
+    write(_HEADER)
 
-    if output_format.lower() == 'dot':
-        Path(output_path).write_text(dot_content)
-        print(f"✅ DOT file saved to {output_path}")
-        print(f"   Generate image with: dot -Tpng {output_path} -o event_tree.png")
-    else:
-        # For other formats, save as .dot and show conversion command
-        dot_path = str(Path(output_path).with_suffix('.dot'))
-        Path(dot_path).write_text(dot_content)
-        print(f"✅ DOT file saved to {dot_path}")
-        print(f"   Convert to {output_format}: dot -T{output_format} {dot_path} -o {output_path}")
+    # Agent color
+    agent_color = '#ffcc80'
+
+    # Add event nodes
+    write('    // Events\n')
+    for event in analyzer.get_sorted_events():
+        write(f'    "{event.name}" [fillcolor="#e0e0e0", shape=ellipse, fontsize=10, '
+              f'class="namespace-{event.namespace}"];\n')
+
+    write('\n')
+    write('    // Agents\n')
+    for agent in analyzer.get_sorted_agents():
+        label = agent.name.replace('_', ' ')
+        write(f'    "{agent.name}" [label="{label}", fillcolor="{agent_color}", shape=box, '
+              f'fontsize=10, class="namespace-{agent.namespace}"];\n')
+
+    write('\n')
+    write('    // Edges\n')
+
+    # Add edges: event -> agent (subscription), then agent -> event (publication)
+    write(analyzer.get_dot_edges())
+
+    write('}')
@@ -20,7 +20,7 @@ Available generators:
 """
 from __future__ import annotations
 
-from typing import Dict, Optional, Type
+from typing import Dict, KeysView, Optional, Type
 
 from .base import GraphGenerator
 from .complete import CompleteGraphGenerator
@@ -32,8 +32,9 @@ _GENERATOR_REGISTRY: Dict[str, Type[GraphGenerator]] = {
     'full-tree': FullTreeGraphGenerator,
 }
 
-# Public list of available generator types
-AVAILABLE_GENERATORS = list(_GENERATOR_REGISTRY.keys())
+# Public, read-only live view of the available generator types: registering a
+# generator updates it in place, so importers never hold a stale copy
+AVAILABLE_GENERATORS: KeysView[str] = _GENERATOR_REGISTRY.keys()
 
 
 def get_generator(
@@ -89,16 +90,13 @@ def register_generator(graph_type: str, generator_class: Type[GraphGenerator]) -
         ...     def graph_type(self) -> str:
         ...         return "custom"
         ...
-        ...     def generate(self, analyzer, output_path=None) -> str:
+        ...     def generate(self, analyzer, output_path=None, return_content=True) -> str:
         ...         return "digraph Custom { ... }"
         ...
         >>> register_generator('custom', MyCustomGenerator)
         >>> generator = get_generator('custom')
     """
     _GENERATOR_REGISTRY[graph_type] = generator_class
-    # Update the public list
-    global AVAILABLE_GENERATORS
-    AVAILABLE_GENERATORS = list(_GENERATOR_REGISTRY.keys())
 
 
 __all__ = [
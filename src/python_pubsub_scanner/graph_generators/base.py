@@ -39,13 +39,20 @@ class GraphGenerator(ABC):
         self.fontname = fontname or "Arial"
 
     @abstractmethod
-    def generate(self, analyzer: EventFlowAnalyzer, output_path: Optional[str] = None) -> str:
+    def generate(
+            self,
+            analyzer: EventFlowAnalyzer,
+            output_path: Optional[str] = None,
+            return_content: bool = True
+    ) -> str:
         """
         Generate DOT content for the graph.
 
         Args:
             analyzer: The EventFlowAnalyzer containing the parsed event flow data.
             output_path: Optional path to write the DOT file to. If provided, writes to file.
+            return_content: When False and output_path is given, the DOT content may be
+                written to the file without being built in memory, and '' is returned.
 
         Returns:
             The generated DOT content as a string.
@@ -5,13 +5,28 @@ Generates a complete event flow graph showing all events, agents, and their conn
 """
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING
+import io
+from typing import Optional, TextIO, TYPE_CHECKING
 
 from .base import GraphGenerator
 
 if TYPE_CHECKING:
     from ..analyze_event_flow import EventFlowAnalyzer
 
+# Document header, filled with the generator's font name
+_HEADER_TEMPLATE = (
+    'digraph EventFlow {\n'
+    '    graph [fontname="%(fontname)s"];\n'
+    '    rankdir=TB;\n'
+    '    node [shape=box, style="filled,rounded", fontname="%(fontname)s", fontsize=10];\n'
+    '    edge [arrowsize=0.8, fontname="%(fontname)s"];\n'
+    '\n'
+)
+
+# Node line templates, filled with %-formatting (cheaper than an f-string per line)
+_EVENT_NODE_TEMPLATE = '    "%s" [fillcolor="%s", shape=%s, class="namespace-%s"];\n'
+_AGENT_NODE_TEMPLATE = '    "%s" [fillcolor="%s", class="namespace-%s"];\n'
+
 
 class CompleteGraphGenerator(GraphGenerator):
     """
@@ -25,17 +40,29 @@ class CompleteGraphGenerator(GraphGenerator):
     def graph_type(self) -> str:
         return "complete"
 
-    def generate(self, analyzer: EventFlowAnalyzer, output_path: Optional[str] = None) -> str:
+    def generate(
+            self,
+            analyzer: EventFlowAnalyzer,
+            output_path: Optional[str] = None,
+            return_content: bool = True
+    ) -> str:
         """
         Generate DOT content for the complete graph.
 
         Args:
             analyzer: The EventFlowAnalyzer containing the parsed event flow data.
             output_path: Optional path to write the DOT file to.
+            return_content: When False and output_path is given, stream the DOT content
+                to the file without building it in memory.
 
         Returns:
-            The generated DOT content as a string.
+            The generated DOT content as a string ('' when it was only streamed to the file).
         """
+        if output_path and not return_content:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                self.write(analyzer, f)
+            return ''
+
         dot_content = self._generate_dot_content(analyzer)
 
         if output_path:
@@ -54,52 +81,47 @@ class CompleteGraphGenerator(GraphGenerator):
         Returns:
             The generated DOT content as a string.
         """
-        lines = [
-            'digraph EventFlow {',
-            f'    graph [fontname="{self.fontname}"];',
-            '    rankdir=TB;',
-            f'    node [shape=box, style="filled,rounded", fontname="{self.fontname}", fontsize=10];',
-            f'    edge [arrowsize=0.8, fontname="{self.fontname}"];',
-            ''
-        ]
-
-        events = analyzer.get_all_events()
-        agents = analyzer.get_all_agents()
+        buffer = io.StringIO()
+        self.write(analyzer, buffer)
+        return buffer.getvalue()
 
-        # Add event nodes with namespace-based styling
-        for event in sorted(events):
-            default_color = "#e0e0e0"
-            default_shape = "ellipse"
+    def write(self, analyzer: EventFlowAnalyzer, fp: TextIO) -> None:
+        """
+        Write DOT content for the complete graph to a text stream, line by line.
 
-            fillcolor = self.colors.get(event.namespace, default_color)
-            shape = self.shapes.get(event.namespace, default_shape)
+        Args:
+            analyzer: The EventFlowAnalyzer containing the parsed event flow data.
+            fp: Writable text stream (e.g., an open file or io.StringIO).
+        """
+        write = fp.write
+        write(_HEADER_TEMPLATE % {'fontname': self.fontname})
+
+        # Style lookups bound once, outside the per-node loops
+        color_of = self.colors.get
+        shape_of = self.shapes.get
 
-            lines.append(
-                f'    "{event.name}" [fillcolor="{fillcolor}", shape={shape}, '
-                f'class="namespace-{event.namespace}"];'
+        # Add event nodes with namespace-based styling
+        fp.writelines(
+            _EVENT_NODE_TEMPLATE % (
+                event.name,
+                color_of(event.namespace, "#e0e0e0"),
+                shape_of(event.namespace, "ellipse"),
+                event.namespace
             )
+            for event in analyzer.get_sorted_events()
+        )
 
         # Add agent nodes with namespace-based styling
-        for agent in sorted(agents):
-            default_color = "#ffcc80"
-            fillcolor = self.colors.get(agent.namespace, default_color)
-
-            lines.append(
-                f'    "{agent.name}" [fillcolor="{fillcolor}", '
-                f'class="namespace-{agent.namespace}"];'
+        fp.writelines(
+            _AGENT_NODE_TEMPLATE % (
+                agent.name, color_of(agent.namespace, "#ffcc80"), agent.namespace
             )
+            for agent in analyzer.get_sorted_agents()
+        )
 
-        lines.append('')
-
-        # Add edges for subscriptions (event -> subscriber)
-        for event, subscribers in sorted(analyzer.event_to_subscribers.items()):
-            for subscriber in subscribers:
-                lines.append(f'    "{event.name}" -> "{subscriber.name}";')
+        write('\n')
 
-        # Add edges for publications (agent -> event)
-        for agent, publications in sorted(analyzer.publications.items()):
-            for event in publications:
-                lines.append(f'    "{agent.name}" -> "{event.name}";')
+        # Add edges for subscriptions (event -> subscriber), then publications (agent -> event)
+        write(analyzer.get_dot_edges())
 
-        lines.append('}')
-        return '\n'.join(lines)
+        write('}')
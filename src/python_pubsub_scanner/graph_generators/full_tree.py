@@ -5,11 +5,10 @@ Generates a hierarchical tree representation of the event flow.
 """
 from __future__ import annotations
 
-import tempfile
 from typing import Optional, TYPE_CHECKING
 
 from .base import GraphGenerator
-from ..generate_hierarchical_tree import generate_hierarchical_tree
+from ..generate_hierarchical_tree import hierarchical_tree_to_string, write_hierarchical_tree
 
 if TYPE_CHECKING:
     from ..analyze_event_flow import EventFlowAnalyzer
@@ -27,25 +26,34 @@ class FullTreeGraphGenerator(GraphGenerator):
     def graph_type(self) -> str:
         return "full-tree"
 
-    def generate(self, analyzer: EventFlowAnalyzer, output_path: Optional[str] = None) -> str:
+    def generate(
+            self,
+            analyzer: EventFlowAnalyzer,
+            output_path: Optional[str] = None,
+            return_content: bool = True
+    ) -> str:
         """
         Generate DOT content for the full-tree graph.
 
         Args:
             analyzer: The EventFlowAnalyzer containing the parsed event flow data.
             output_path: Optional path to write the DOT file to.
+            return_content: When False and output_path is given, stream the DOT content
+                to the file without building it in memory.
 
         Returns:
-            The generated DOT content as a string.
+            The generated DOT content as a string ('' when it was only streamed to the file).
         """
-        # If output_path is provided, use it directly
+        if output_path and not return_content:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                write_hierarchical_tree(analyzer, f)
+            return ''
+
+        # Built in memory: no temporary file round-trip just to capture the string
+        dot_content = hierarchical_tree_to_string(analyzer)
+
         if output_path:
-            generate_hierarchical_tree(analyzer, output_path, output_format='dot')
-            with open(output_path, 'r', encoding='utf-8') as f:
-                return f.read()
-
-        # Otherwise, use a temporary file
-        with tempfile.NamedTemporaryFile(mode='w+', suffix='.dot', delete=True, encoding='utf-8') as temp_f:
-            generate_hierarchical_tree(analyzer, temp_f.name, output_format='dot')
-            temp_f.seek(0)
-            return temp_f.read()
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(dot_content)
+
+        return dot_content
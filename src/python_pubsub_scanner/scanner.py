@@ -47,18 +47,60 @@ Library Usage:
 """
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import signal
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, FrozenSet, List, Set, Tuple
 from urllib.parse import urlparse
 
 import requests
 
-from .analyze_event_flow import EventFlowAnalyzer
+from .analyze_event_flow import AgentParseCache, EventFlowAnalyzer
 from .anomaly_detector import AnomalyDetector
 from .config_helper import ConfigHelper
-from .graph_generators import get_generator
+from .graph_generators import GraphGenerator, get_generator
+
+# Compact, UTF-8 payload encoder: the DOT content dominates the body, so it is kept
+# unescaped and free of separator padding instead of requests' default json.dumps
+_PAYLOAD_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), allow_nan=False)
+
+# Clock of the continuous-mode schedule, a module alias so tests can replace it
+# without patching time.monotonic for every thread
+_monotonic = time.monotonic
+
+
+class ScanSummary(dict):
+    """
+    Push results of a scan, mapping each graph type to whether it was pushed successfully.
+
+    A regular dict, which also keeps the number of successful pushes up to date as
+    results are recorded, so callers can read the tally without another pass.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.successes = 0
+
+    def record(self, graph_type: str, success: bool) -> None:
+        """
+        Record the push result of a graph type.
+
+        Args:
+            graph_type: The graph type (e.g., 'complete').
+            success: Whether the graph was pushed successfully.
+        """
+        self.successes += bool(success) - bool(self.get(graph_type, False))
+        self[graph_type] = success
+
+    @property
+    def total(self) -> int:
+        """Number of graph types recorded."""
+        return len(self)
 
 
 class EventFlowScanner:
@@ -104,10 +146,32 @@ class EventFlowScanner:
         self.shapes = shapes or {}
         self.fontname = fontname
         self.postman_collection_generated = False  # Flag to ensure single generation
-
-        if not self.agents_dir.exists() or not self.agents_dir.is_dir():
+        self._postman_lock = threading.Lock()  # Graphs are pushed concurrently
+        self._stop_event = threading.Event()  # Wakes run_continuous out of its sleep
+
+        # One HTTP session for the scanner's lifetime: keep-alive reuses the API
+        # connection across pushes
+        self._session = requests.Session()
+        self._session.headers.update({'Content-Type': 'application/json'})
+
+        # Previous scan, reused while the agent and event sources are unchanged
+        self._source_fingerprint: Optional[FrozenSet[Tuple[str, int, int]]] = None
+        self._analyzer: Optional[EventFlowAnalyzer] = None
+        self._anomalies: Optional[Dict[str, Any]] = None
+        self._dot_contents: Dict[str, str] = {}
+        # Parsed agent files, so that a change only reparses the files that changed
+        self._parse_cache = AgentParseCache()
+
+        # Generators only hold the scanner's styling, which is fixed: one instance per graph type
+        self._generators: Dict[str, GraphGenerator] = {}
+
+        # Digest of the last graph the API accepted, per graph type
+        self._pushed_digests: Dict[str, Tuple[bytes, bool]] = {}
+
+        # is_dir() is False for a missing path too, so one stat() covers both cases
+        if not self.agents_dir.is_dir():
             raise ValueError(f"Agents directory not found or not a directory: {self.agents_dir}")
-        if not self.events_dir.exists() or not self.events_dir.is_dir():
+        if not self.events_dir.is_dir():
             raise ValueError(f"Events directory not found or not a directory: {self.events_dir}")
 
     @classmethod
@@ -140,70 +204,183 @@ class EventFlowScanner:
             fontname=config.get_graph_fontname()
         )
 
-    def scan_once(self) -> Dict[str, bool]:
+    def scan_once(self) -> ScanSummary:
         """
         Perform a single scan, push to API, and generate Postman collection if configured.
+
+        While no agent or event file has changed since the previous scan, its analysis,
+        anomalies and DOT content are reused. A graph identical to the last one the API
+        accepted is not pushed again, and counts as a success.
+
+        Returns:
+            A ScanSummary mapping each graph type to its push result, with the success tally.
         """
         print(f"[SCAN] Starting scan at {time.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"[SCAN] Agents directory: {self.agents_dir}")
 
-        analyzer = EventFlowAnalyzer(self.agents_dir, self.events_dir)
-        analyzer.analyze()
+        fingerprint = self._fingerprint_sources()
+        if self._analyzer is not None and fingerprint == self._source_fingerprint:
+            print("[SCAN] Sources unchanged since last scan, reusing previous analysis")
+            analyzer = self._analyzer
+        else:
+            analyzer = EventFlowAnalyzer(self.agents_dir, self.events_dir)
+            analyzer.analyze(parse_cache=self._parse_cache)
+            self._source_fingerprint = fingerprint
+            self._analyzer = analyzer
+            self._anomalies = self._detect_anomalies(analyzer)
+            self._dot_contents = {}
 
         events = analyzer.get_all_events()  # Now returns Set[NamespacedItem]
         agents = analyzer.get_all_agents()  # Now returns Set[NamespacedItem]
         print(f"[SCAN] Found {len(events)} events, {len(agents)} agents")
 
-        namespaces = analyzer.get_all_namespaces()  # Get namespaces from both agents and events
-        print(f"[SCAN] Found {len(namespaces)} namespaces: {sorted(namespaces)}")
+        # Namespaces from both agents and events, sorted once for the log and every payload
+        namespaces = sorted(analyzer.get_all_namespaces())
+        print(f"[SCAN] Found {len(namespaces)} namespaces: {namespaces}")
         graph_types = ['complete', 'full-tree']
-        results = {}
+        results = ScanSummary()
+
+        # Stats and anomalies depend only on the analysis, not on the graph type: compute
+        # them once per analysis and ship the same batch with every graph payload.
+        # Connections are counted on the sorted edge list the DOT writers share.
+        stats = {
+            'events': len(events),
+            'agents': len(agents),
+            'connections': len(analyzer.get_sorted_edges()),
+        }
 
-        for graph_type in graph_types:
-            try:
-                print(f"[SCAN] Generating {graph_type} graph...")
-                dot_content = self._generate_dot(analyzer, graph_type)
+        # Graphs are independent: generate and push them concurrently, so one graph's
+        # POST overlaps with the other's DOT generation; results are recorded in order
+        with ThreadPoolExecutor(max_workers=len(graph_types)) as executor:
+            outcomes = executor.map(
+                lambda graph_type: self._process_graph(analyzer, graph_type, stats, namespaces),
+                graph_types
+            )
+            for graph_type, success in zip(graph_types, outcomes):
+                results.record(graph_type, success)
+
+        return results
+
+    def _process_graph(
+            self,
+            analyzer: EventFlowAnalyzer,
+            graph_type: str,
+            stats: Dict[str, int],
+            namespaces: List[str]
+    ) -> bool:
+        """
+        Generate one graph and push it to the API, unless it is unchanged since the last push.
+
+        Args:
+            analyzer: The EventFlowAnalyzer containing the parsed event flow data.
+            graph_type: The type of graph to generate (e.g., 'complete', 'full-tree').
+            stats: The payload 'stats' section.
+            namespaces: All namespaces of the analysis, sorted.
 
+        Returns:
+            True if the graph was pushed successfully (or was already up to date), False otherwise.
+        """
+        anomalies = self._anomalies
+        try:
+            print(f"[SCAN] Generating {graph_type} graph...")
+            dot_content = self._dot_contents.get(graph_type)
+            if dot_content is None:
+                dot_content = self._generate_dot(analyzer, graph_type)
                 if dot_content:
-                    total_connections = sum(len(s) for s in analyzer.event_to_subscribers.values()) + \
-                                        sum(len(p) for p in analyzer.publications.values())
-
-                    payload: Dict[str, Any] = {
-                        'graph_type': graph_type,
-                        'dot_content': dot_content,
-                        'stats': {
-                            'events': len(events),
-                            'agents': len(agents),
-                            'connections': total_connections,
-                        },
-                        'namespaces': list(namespaces)  # Always include namespaces key
-                    }
+                    self._dot_contents[graph_type] = dot_content
 
-                    # APPEND: Detect anomalies and add to payload (non-invasive)
-                    try:
-                        detector = AnomalyDetector(analyzer)
-                        anomalies = detector.detect_all()
-                        anomaly_summary = detector.get_anomaly_summary()
+            if not dot_content:
+                print(f"[SCAN] Failed to generate {graph_type}")
+                return False
 
-                        payload['anomalies'] = {
-                            'summary': anomaly_summary,
-                            'details': anomalies
-                        }
-                        print(f"[SCAN] Detected {anomaly_summary['total_anomalies']} anomalies")
-                    except Exception as e:
-                        print(f"[SCAN] Warning: Failed to detect anomalies: {e}")
-                        # Continue without anomalies - no regression risk
-
-                    success = self._push_to_api(payload)
-                    results[graph_type] = success
-                else:
-                    print(f"[SCAN] Failed to generate {graph_type}")
-                    results[graph_type] = False
-            except Exception as e:
-                print(f"[SCAN] Error processing {graph_type}: {e}")
-                results[graph_type] = False
+            # The DOT content captures every node and edge of the analysis, so an
+            # unchanged digest means the whole payload is unchanged
+            digest = (
+                hashlib.blake2b(dot_content.encode('utf-8'), digest_size=16).digest(),
+                anomalies is not None
+            )
+            if self._pushed_digests.get(graph_type) == digest:
+                print(f"[SCAN] {graph_type} unchanged since last push, skipping")
+                return True
 
-        return results
+            payload: Dict[str, Any] = {
+                'graph_type': graph_type,
+                'dot_content': dot_content,
+                'stats': stats,
+                'namespaces': namespaces  # Always include namespaces key
+            }
+
+            # APPEND: Add detected anomalies to payload (non-invasive)
+            if anomalies is not None:
+                payload['anomalies'] = anomalies
+
+            success = self._push_to_api(payload)
+            if success:
+                self._pushed_digests[graph_type] = digest
+            else:
+                self._pushed_digests.pop(graph_type, None)
+            return success
+        except Exception as e:
+            print(f"[SCAN] Error processing {graph_type}: {e}")
+            return False
+
+    def _fingerprint_sources(self) -> FrozenSet[Tuple[str, int, int]]:
+        """
+        Fingerprint the files the analysis reads, by path, modification time and size.
+
+        Covers agent files and event files, so an added, removed or edited file
+        changes the fingerprint.
+
+        Returns:
+            A frozenset of (path, mtime_ns, size) tuples.
+        """
+        # os.scandir reads entry names and types straight from the directory listing,
+        # without the Path objects and pattern matching of glob, on every scan
+        fingerprint: Set[Tuple[str, int, int]] = set()
+        try:
+            with os.scandir(self.events_dir) as namespace_entries:
+                namespace_dirs = [entry.path for entry in namespace_entries if entry.is_dir()]
+        except OSError:
+            namespace_dirs = []
+
+        for directory in [os.fspath(self.agents_dir), *namespace_dirs]:
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if not entry.name.endswith('.py'):
+                            continue
+                        try:
+                            stat_result = entry.stat()
+                        except OSError:
+                            continue
+                        fingerprint.add((entry.path, stat_result.st_mtime_ns, stat_result.st_size))
+            except OSError:
+                continue
+        return frozenset(fingerprint)
+
+    @staticmethod
+    def _detect_anomalies(analyzer: EventFlowAnalyzer) -> Optional[Dict[str, Any]]:
+        """
+        Detect anomalies in the analyzed event flow.
+
+        Args:
+            analyzer: The EventFlowAnalyzer containing the parsed event flow data.
+
+        Returns:
+            The payload 'anomalies' section ('summary' and 'details'), or None if detection failed.
+        """
+        try:
+            detector = AnomalyDetector(analyzer)
+            anomalies: Dict[str, Any] = {
+                'summary': detector.get_anomaly_summary(),
+                'details': detector.detect_all()
+            }
+            print(f"[SCAN] Detected {anomalies['summary']['total_anomalies']} anomalies")
+            return anomalies
+        except Exception as e:
+            print(f"[SCAN] Warning: Failed to detect anomalies: {e}")
+            # Continue without anomalies - no regression risk
+            return None
 
     def _generate_postman_collection(self, payload: Dict[str, Any]):
         """
@@ -256,11 +433,10 @@ class EventFlowScanner:
         """
         endpoint = f"{self.api_url}/api/graph"
         try:
-            response = requests.post(
+            response = self._session.post(
                 endpoint,
-                json=payload,
-                timeout=30,
-                headers={'Content-Type': 'application/json'}
+                data=_PAYLOAD_ENCODER.encode(payload).encode('utf-8'),
+                timeout=30
             )
 
             if response.status_code == 201:
@@ -268,8 +444,10 @@ class EventFlowScanner:
                 print(f"[SCAN] ✅ Pushed {payload['graph_type']} successfully (Timestamp: {result.get('timestamp')})")
 
                 if self.postman_dir and not self.postman_collection_generated:
-                    self._generate_postman_collection(payload)
-                    self.postman_collection_generated = True
+                    with self._postman_lock:
+                        if not self.postman_collection_generated:
+                            self._generate_postman_collection(payload)
+                            self.postman_collection_generated = True
 
                 return True
             else:
@@ -279,9 +457,26 @@ class EventFlowScanner:
             print(f"[SCAN] ❌ API request failed: {e}")
             return False
 
+    def close(self) -> None:
+        """
+        Release the pooled API connections held by the scanner's HTTP session.
+        """
+        self._session.close()
+
+    def stop(self) -> None:
+        """
+        Ask run_continuous to stop, interrupting its sleep between scans immediately.
+
+        Safe to call from another thread or a signal handler. A running scan completes first.
+        """
+        self._stop_event.set()
+
     def run_continuous(self) -> None:
         """
         Run scanner in continuous mode with configured interval
+
+        Stops on Ctrl+C, on SIGTERM (when run from the main thread) or when stop() is called,
+        without waiting for the current interval to elapse. The HTTP session is closed on exit.
         """
         if self.interval is None:
             raise ValueError("Cannot run continuous mode without interval")
@@ -291,13 +486,38 @@ class EventFlowScanner:
         print(f"[SCAN] Press Ctrl+C to stop")
         print()
 
+        # Signal handlers can only be installed from the main thread
+        previous_handler = None
+        if threading.current_thread() is threading.main_thread():
+            previous_handler = signal.signal(signal.SIGTERM, lambda signum, frame: self.stop())
+
         try:
-            while True:
+            # Scans are scheduled on a fixed monotonic grid, so the time a scan takes
+            # does not push every following scan back
+            next_scan = _monotonic()
+            while not self._stop_event.is_set():
                 self.scan_once()
-                print(f"[SCAN] Sleeping for {self.interval} seconds...")
-                time.sleep(self.interval)
+
+                next_scan += self.interval
+                now = _monotonic()
+                if next_scan <= now:
+                    # Overran one or more intervals: skip the missed ticks rather than
+                    # scanning back-to-back
+                    missed = int((now - next_scan) // self.interval) + 1
+                    next_scan += missed * self.interval
+                    print(f"[SCAN] Scan overran the interval, skipping {missed} tick(s)")
+
+                delay = next_scan - now
+                print(f"[SCAN] Sleeping for {delay:.1f} seconds...")
+                if self._stop_event.wait(delay):
+                    print("[SCAN] Stop requested")
+                    break
         except KeyboardInterrupt:
             print("\n[SCAN] Stopped by user")
+        finally:
+            if previous_handler is not None:
+                signal.signal(signal.SIGTERM, previous_handler)
+            self.close()
 
     def _generate_dot(self, analyzer: EventFlowAnalyzer, graph_type: str) -> Optional[str]:
         """
@@ -311,12 +531,15 @@ class EventFlowScanner:
             The generated DOT content as a string, or None if generation fails.
         """
         try:
-            generator = get_generator(
-                graph_type=graph_type,
-                colors=self.colors,
-                shapes=self.shapes,
-                fontname=self.fontname
-            )
+            generator = self._generators.get(graph_type)
+            if generator is None:
+                generator = get_generator(
+                    graph_type=graph_type,
+                    colors=self.colors,
+                    shapes=self.shapes,
+                    fontname=self.fontname
+                )
+                self._generators[graph_type] = generator
             return generator.generate(analyzer)
         except ValueError as e:
             print(f"[SCAN] Unknown graph type '{graph_type}': {e}")
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import sys
+import unittest
+
+from python_pubsub_scanner.agent_graph import build_agent_graph, strongly_connected_components
+from python_pubsub_scanner.analyze_event_flow import NamespacedItem
+
+
+class TestAgentGraph(unittest.TestCase):
+    """
+    Tests for the CSR agent graph and its strongly connected components.
+    """
+
+    @staticmethod
+    def _chain_graph(length, close_loop=False):
+        """Build agents Agent0 -> Agent1 -> ... linked through one event per hop."""
+        agents = [NamespacedItem(name=f"Agent{i:05d}", namespace="test") for i in range(length)]
+        events = [NamespacedItem(name=f"Event{i:05d}", namespace="test") for i in range(length)]
+        publications = {agents[i]: [events[i]] for i in range(length)}
+        event_to_subscribers = {events[i]: [agents[i + 1]] for i in range(length - 1)}
+        if close_loop:
+            event_to_subscribers[events[-1]] = [agents[0]]
+        return build_agent_graph(agents, publications, event_to_subscribers)
+
+    def test_build_excludes_self_loops(self):
+        """Verify an agent subscribing to its own event does not reach itself."""
+        agent = NamespacedItem(name="Echo", namespace="test")
+        event = NamespacedItem(name="Ping", namespace="test")
+
+        graph = build_agent_graph([agent], {agent: [event]}, {event: [agent]})
+
+        self.assertEqual(graph.agents, (agent,))
+        self.assertEqual(list(graph.neighbors(0)), [])
+
+    def test_build_includes_agents_without_edges(self):
+        """Verify agents with no connections still get an id."""
+        lonely = NamespacedItem(name="Lonely", namespace="test")
+
+        graph = build_agent_graph([lonely], {}, {})
+
+        self.assertEqual(graph.agent_ids, {lonely: 0})
+        self.assertEqual(list(graph.offsets), [0, 0])
+
+    def test_build_labels_edges_with_events(self):
+        """Verify each edge carries the sorted events linking the publisher to the subscriber."""
+        publisher = NamespacedItem(name="Publisher", namespace="test")
+        subscriber = NamespacedItem(name="Subscriber", namespace="test")
+        event_b = NamespacedItem(name="EventB", namespace="test")
+        event_a = NamespacedItem(name="EventA", namespace="test")
+        unrelated = NamespacedItem(name="Unrelated", namespace="test")
+
+        graph = build_agent_graph(
+            [publisher, subscriber],
+            {publisher: [event_b, event_a, unrelated]},
+            {event_a: [subscriber], event_b: [subscriber]}
+        )
+
+        edge = (graph.agent_ids[publisher], graph.agent_ids[subscriber])
+        self.assertEqual(graph.edge_events, {edge: [event_a, event_b]})
+        self.assertEqual(
+            list(graph.neighbors(graph.agent_ids[publisher])), [graph.agent_ids[subscriber]]
+        )
+
+    def test_components_of_acyclic_graph_are_singletons(self):
+        """Verify every agent is its own component when there is no cycle."""
+        graph = self._chain_graph(4)
+
+        components = strongly_connected_components(graph)
+
+        self.assertEqual(sorted(len(c) for c in components), [1, 1, 1, 1])
+
+    def test_components_group_cycles(self):
+        """Verify agents in a cycle share a component, separate from agents outside it."""
+        agent_a = NamespacedItem(name="AgentA", namespace="test")
+        agent_b = NamespacedItem(name="AgentB", namespace="test")
+        outsider = NamespacedItem(name="Outsider", namespace="test")
+        event_x = NamespacedItem(name="EventX", namespace="test")
+        event_y = NamespacedItem(name="EventY", namespace="test")
+        event_z = NamespacedItem(name="EventZ", namespace="test")
+
+        # Outsider -> AgentA <-> AgentB
+        publications = {agent_a: [event_x], agent_b: [event_y], outsider: [event_z]}
+        event_to_subscribers = {event_x: [agent_b], event_y: [agent_a], event_z: [agent_a]}
+        graph = build_agent_graph([agent_a, agent_b, outsider], publications, event_to_subscribers)
+
+        components = {
+            frozenset(graph.agents[i] for i in c) for c in strongly_connected_components(graph)
+        }
+
+        self.assertEqual(components, {frozenset([agent_a, agent_b]), frozenset([outsider])})
+
+    def test_components_of_deep_graph(self):
+        """Verify a cycle longer than the recursion limit is found without recursing."""
+        length = sys.getrecursionlimit() + 100
+        graph = self._chain_graph(length, close_loop=True)
+
+        components = strongly_connected_components(graph)
+
+        self.assertEqual(len(components), 1)
+        self.assertEqual(len(components[0]), length)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,450 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from python_pubsub_scanner.analyze_event_flow import (
+    AgentParseCache,
+    EventFlowAnalyzer,
+    NamespacedItem
+)
+
+
+class TestNamespacedItem(unittest.TestCase):
+    """
+    Tests for the NamespacedItem value type.
+    """
+
+    def test_items_sort_by_namespace_then_name(self):
+        """Verify items are ordered by namespace first, then by name."""
+        a_zeta = NamespacedItem(name="A", namespace="zeta")
+        b_alpha = NamespacedItem(name="B", namespace="alpha")
+        a_alpha = NamespacedItem(name="A", namespace="alpha")
+
+        self.assertEqual(sorted([a_zeta, b_alpha, a_alpha]), [a_alpha, b_alpha, a_zeta])
+
+    def test_comparison_operators_agree(self):
+        """Verify <, >, <= and >= all order items by namespace first, then by name."""
+        z_alpha = NamespacedItem(name="Z", namespace="alpha")
+        a_beta = NamespacedItem(name="A", namespace="beta")
+
+        self.assertTrue(z_alpha < a_beta)
+        self.assertFalse(z_alpha > a_beta)
+        self.assertTrue(z_alpha <= a_beta)
+        self.assertFalse(z_alpha >= a_beta)
+        self.assertTrue(z_alpha <= z_alpha)
+        self.assertTrue(z_alpha >= z_alpha)
+        self.assertIs(max([z_alpha, a_beta]), a_beta)
+        self.assertIs(min([a_beta, z_alpha]), z_alpha)
+
+    def test_items_are_hashable_values(self):
+        """Verify equal items collapse to a single key in sets and dicts."""
+        first = NamespacedItem(name="UserCreated", namespace="users")
+        second = NamespacedItem(name="UserCreated", namespace="users")
+
+        self.assertEqual(first, second)
+        self.assertEqual(len({first, second}), 1)
+        self.assertNotEqual(first, NamespacedItem(name="UserCreated", namespace="orders"))
+        self.assertEqual(hash(first), hash(second))
+
+
+class TestEventFlowAnalyzer(unittest.TestCase):
+    """
+    Tests for the EventFlowAnalyzer, using a temporary filesystem with real agent and event files.
+    """
+
+    def setUp(self):
+        """Set up a temporary agents/events directory structure."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.project_root = Path(self.temp_dir.name)
+        self.agents_dir = self.project_root / "agents"
+        self.events_dir = self.project_root / "events"
+
+        self.agents_dir.mkdir()
+        (self.events_dir / "orders").mkdir(parents=True)
+        (self.events_dir / "users").mkdir(parents=True)
+
+        (self.events_dir / "orders" / "order_events.py").write_text(
+            "class OrderPlaced(BaseModel):\n    pass\n\n"
+            "class OrderShipped(BaseModel):\n    pass\n"
+        )
+        (self.events_dir / "users" / "user_events.py").write_text(
+            "class UserCreated(BaseModel):\n    pass\n"
+        )
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def _write_agent(self, name, body):
+        (self.agents_dir / f"{name}.py").write_text(body)
+
+    def _analyze(self):
+        analyzer = EventFlowAnalyzer(self.agents_dir, self.events_dir)
+        analyzer.analyze()
+        return analyzer
+
+    def test_event_namespaces_from_events_directory(self):
+        """Verify event classes are mapped to the name of their namespace directory."""
+        analyzer = EventFlowAnalyzer(self.agents_dir, self.events_dir)
+
+        self.assertEqual(analyzer.event_class_to_namespace, {
+            "OrderPlaced": "orders",
+            "OrderShipped": "orders",
+            "UserCreated": "users",
+        })
+
+    def test_event_classes_parsed_from_source(self):
+        """Verify multi-line and decorated classes are found, but not class keywords in strings."""
+        (self.events_dir / "users" / "profile_events.py").write_text(
+            '"""\nclass NotAnEvent(BaseModel): documented only\n"""\n\n'
+            "@dataclass\n"
+            "class ProfileUpdated(\n"
+            "    BaseModel,\n"
+            "):\n"
+            "    pass\n"
+        )
+        analyzer = EventFlowAnalyzer(self.agents_dir, self.events_dir)
+
+        self.assertEqual(analyzer.event_class_to_namespace["ProfileUpdated"], "users")
+        self.assertNotIn("NotAnEvent", analyzer.event_class_to_namespace)
+
+    def test_event_classes_nested_in_blocks(self):
+        """Verify classes in module-level if/try blocks are found, but not nested helpers."""
+        (self.events_dir / "orders" / "compat_events.py").write_text(
+            "import sys\n\n"
+            "if sys.version_info >= (3, 8):\n"
+            "    class OrderPlaced(BaseModel):\n"
+            "        pass\n"
+            "else:\n"
+            "    OrderPlaced = None\n\n"
+            "try:\n"
+            "    class OrderShipped(BaseModel):\n"
+            "        pass\n"
+            "except ImportError:\n"
+            "    pass\n\n"
+            "class _Helper:\n"
+            "    class Meta:\n"
+            "        pass\n\n"
+            "def factory():\n"
+            "    class LocalEvent(BaseModel):\n"
+            "        pass\n"
+        )
+        analyzer = EventFlowAnalyzer(self.agents_dir, self.events_dir)
+
+        self.assertEqual(analyzer.event_class_to_namespace["OrderPlaced"], "orders")
+        self.assertEqual(analyzer.event_class_to_namespace["OrderShipped"], "orders")
+        for helper in ("_Helper", "Meta", "LocalEvent"):
+            self.assertNotIn(helper, analyzer.event_class_to_namespace)
+
+    def test_event_classes_from_unparsable_source(self):
+        """Verify classes are still collected from files that are not valid Python."""
+        (self.events_dir / "users" / "broken_events.py").write_text(
+            "class UserDeleted(BaseModel):\n    def broken(:\n"
+        )
+        analyzer = EventFlowAnalyzer(self.agents_dir, self.events_dir)
+
+        self.assertEqual(analyzer.event_class_to_namespace["UserDeleted"], "users")
+
+    def test_subscriptions_and_publications(self):
+        """Verify subscribe and publish calls are extracted into the adjacency maps."""
+        self._write_agent("shipper", (
+            "class Shipper:\n"
+            "    def start(self):\n"
+            "        self.service_bus.subscribe(OrderPlaced.__name__, self.on_order)\n"
+            "    def on_order(self, event):\n"
+            "        self.service_bus.publish(OrderShipped.__name__, {})\n"
+        ))
+        analyzer = self._analyze()
+
+        shipper = NamespacedItem(name="shipper", namespace="orders")
+        order_placed = NamespacedItem(name="OrderPlaced", namespace="orders")
+        order_shipped = NamespacedItem(name="OrderShipped", namespace="orders")
+
+        self.assertEqual(list(analyzer.subscriptions[shipper]), [order_placed])
+        self.assertEqual(list(analyzer.publications[shipper]), [order_shipped])
+        self.assertEqual(list(analyzer.event_to_subscribers[order_placed]), [shipper])
+        self.assertEqual(list(analyzer.event_to_publishers[order_shipped]), [shipper])
+        self.assertEqual(analyzer.get_all_events(), {order_placed, order_shipped})
+        self.assertEqual(analyzer.get_all_agents(), {shipper})
+
+    def test_analysis_results_are_read_only(self):
+        """Verify callers can't mutate the adjacency maps or node sets behind the caches."""
+        self._write_agent(
+            "shipper", "self.service_bus.subscribe(OrderPlaced.__name__, self.on_order)\n"
+        )
+        analyzer = self._analyze()
+
+        shipper = NamespacedItem(name="shipper", namespace="default")
+        order_placed = NamespacedItem(name="OrderPlaced", namespace="orders")
+        intruder = NamespacedItem(name="intruder", namespace="default")
+
+        with self.assertRaises(TypeError):
+            analyzer.event_to_subscribers[order_placed] = frozenset({intruder})
+        with self.assertRaises(AttributeError):
+            analyzer.event_to_subscribers[order_placed].add(intruder)
+        with self.assertRaises(AttributeError):
+            analyzer.get_all_agents().add(intruder)
+
+        self.assertEqual(analyzer.event_to_subscribers[order_placed], {shipper})
+        self.assertEqual(analyzer.get_all_agents(), {shipper})
+        self.assertEqual(analyzer.get_sorted_edges(), (("OrderPlaced", "shipper"),))
+        with self.assertRaises(TypeError):
+            analyzer.get_sorted_event_to_subscribers()[order_placed] = (intruder,)
+
+    def test_names_are_shared_across_agents(self):
+        """Verify every reference to an event reuses one interned name string."""
+        self._write_agent("checkout", "self.service_bus.publish(OrderPlaced.__name__, {})\n")
+        self._write_agent(
+            "shipper", "self.service_bus.subscribe(OrderPlaced.__name__, self.on_order)\n"
+        )
+        analyzer = self._analyze()
+
+        checkout = NamespacedItem(name="checkout", namespace="orders")
+        shipper = NamespacedItem(name="shipper", namespace="default")
+        published, = analyzer.publications[checkout]
+        subscribed, = analyzer.subscriptions[shipper]
+
+        self.assertIs(published.name, subscribed.name)
+        self.assertIs(published.namespace, subscribed.namespace)
+
+    def test_agent_namespace_elected_from_publications(self):
+        """Verify the agent namespace is the most common namespace among published events."""
+        self._write_agent("mixed", (
+            "self.service_bus.subscribe(UserCreated.__name__, self.handler)\n"
+            "self.service_bus.subscribe(UserCreated.__name__, self.other_handler)\n"
+            "self.service_bus.publish(UnknownEvent.__name__, {})\n"
+            "self.service_bus.publish(UserCreated.__name__, {})\n"
+            "self.service_bus.publish(OrderPlaced.__name__, {})\n"
+            "self.service_bus.publish(OrderShipped.__name__, {})\n"
+        ))
+        analyzer = self._analyze()
+
+        self.assertEqual(
+            analyzer.get_all_agents(), {NamespacedItem(name="mixed", namespace="orders")}
+        )
+        self.assertIn(
+            NamespacedItem(name="UnknownEvent", namespace="default"), analyzer.get_all_events()
+        )
+
+    def test_agent_namespace_tie_goes_to_first_published(self):
+        """Verify a tie between namespaces is won by the namespace published first."""
+        self._write_agent("tied", (
+            "self.service_bus.publish(UserCreated.__name__, {})\n"
+            "self.service_bus.publish(OrderPlaced.__name__, {})\n"
+        ))
+        analyzer = self._analyze()
+
+        self.assertEqual(
+            analyzer.get_all_agents(), {NamespacedItem(name="tied", namespace="users")}
+        )
+
+    def test_agent_without_publications_uses_default_namespace(self):
+        """Verify an agent that only subscribes falls back to the 'default' namespace."""
+        self._write_agent(
+            "listener", "self.service_bus.subscribe(OrderPlaced.__name__, self.handler)\n"
+        )
+        analyzer = self._analyze()
+
+        self.assertEqual(
+            analyzer.get_all_agents(), {NamespacedItem(name="listener", namespace="default")}
+        )
+        self.assertEqual(analyzer.get_all_namespaces(), {"default", "orders"})
+
+    def test_repeated_references_are_a_single_edge(self):
+        """Verify subscribing to or publishing an event several times records it once."""
+        self._write_agent("listener", (
+            "self.service_bus.subscribe(OrderPlaced.__name__, self.handler)\n"
+            "self.service_bus.subscribe(OrderPlaced.__name__, self.audit)\n"
+            "self.service_bus.publish(OrderShipped.__name__, {})\n"
+            "self.service_bus.publish(OrderShipped.__name__, {})\n"
+        ))
+        analyzer = self._analyze()
+
+        listener = NamespacedItem(name="listener", namespace="orders")
+        order_placed = NamespacedItem(name="OrderPlaced", namespace="orders")
+        order_shipped = NamespacedItem(name="OrderShipped", namespace="orders")
+
+        self.assertEqual(len(analyzer.subscriptions[listener]), 1)
+        self.assertEqual(len(analyzer.publications[listener]), 1)
+        self.assertEqual(len(analyzer.event_to_subscribers[order_placed]), 1)
+        self.assertEqual(len(analyzer.event_to_publishers[order_shipped]), 1)
+        self.assertEqual(analyzer.generate_graphviz().count('"OrderPlaced" -> "listener";'), 1)
+
+    def test_agent_graph(self):
+        """Verify the CSR agent graph links publishers to the subscribers of their events."""
+        self._write_agent("checkout", "self.service_bus.publish(OrderPlaced.__name__, {})\n")
+        self._write_agent("shipper", (
+            "self.service_bus.subscribe(OrderPlaced.__name__, self.on_order)\n"
+            "self.service_bus.publish(OrderShipped.__name__, {})\n"
+        ))
+        self._write_agent("notifier", (
+            "self.service_bus.subscribe(OrderPlaced.__name__, self.on_order)\n"
+            "self.service_bus.subscribe(OrderShipped.__name__, self.on_shipped)\n"
+        ))
+        analyzer = self._analyze()
+        graph = analyzer.get_agent_graph()
+
+        checkout = NamespacedItem(name="checkout", namespace="orders")
+        shipper = NamespacedItem(name="shipper", namespace="orders")
+        notifier = NamespacedItem(name="notifier", namespace="default")
+
+        self.assertEqual(graph.agents, tuple(sorted([checkout, shipper, notifier])))
+        self.assertEqual(len(graph.offsets), len(graph.agents) + 1)
+
+        def reached(agent):
+            return {graph.agents[i] for i in graph.neighbors(graph.agent_ids[agent])}
+
+        self.assertEqual(reached(checkout), {shipper, notifier})
+        self.assertEqual(reached(shipper), {notifier})
+        self.assertEqual(reached(notifier), set())
+        self.assertIs(analyzer.get_agent_graph(), graph)
+
+    def test_sorted_edges(self):
+        """Verify edges list subscriptions then publications, each sorted, and are computed once."""
+        self._write_agent("shipper", (
+            "self.service_bus.subscribe(OrderPlaced.__name__, self.on_order)\n"
+            "self.service_bus.publish(OrderShipped.__name__, {})\n"
+        ))
+        self._write_agent("audit", (
+            "self.service_bus.subscribe(OrderShipped.__name__, self.on_shipped)\n"
+            "self.service_bus.subscribe(OrderPlaced.__name__, self.on_order)\n"
+        ))
+        analyzer = self._analyze()
+
+        edges = analyzer.get_sorted_edges()
+
+        self.assertEqual(edges, (
+            ("OrderPlaced", "audit"),
+            ("OrderPlaced", "shipper"),
+            ("OrderShipped", "audit"),
+            ("shipper", "OrderShipped"),
+        ))
+        self.assertIs(analyzer.get_sorted_edges(), edges)
+        self.assertEqual(analyzer.get_dot_edges(), (
+            '    "OrderPlaced" -> "audit";\n'
+            '    "OrderPlaced" -> "shipper";\n'
+            '    "OrderShipped" -> "audit";\n'
+            '    "shipper" -> "OrderShipped";\n'
+        ))
+
+        order_placed = NamespacedItem(name="OrderPlaced", namespace="orders")
+        audit = NamespacedItem(name="audit", namespace="default")
+        shipper = NamespacedItem(name="shipper", namespace="orders")
+        self.assertEqual(list(analyzer.get_sorted_event_to_subscribers()), [
+            order_placed, NamespacedItem(name="OrderShipped", namespace="orders")
+        ])
+        self.assertEqual(analyzer.get_sorted_event_to_subscribers()[order_placed], (audit, shipper))
+        self.assertIs(analyzer.get_sorted_publications(), analyzer.get_sorted_publications())
+
+    def test_strongly_connected_components(self):
+        """Verify agents publishing to each other are reported as one component."""
+        self._write_agent("ping", (
+            "self.service_bus.subscribe(OrderShipped.__name__, self.on_shipped)\n"
+            "self.service_bus.publish(OrderPlaced.__name__, {})\n"
+        ))
+        self._write_agent("pong", (
+            "self.service_bus.subscribe(OrderPlaced.__name__, self.on_order)\n"
+            "self.service_bus.publish(OrderShipped.__name__, {})\n"
+        ))
+        self._write_agent(
+            "audit", "self.service_bus.subscribe(OrderPlaced.__name__, self.on_order)\n"
+        )
+        analyzer = self._analyze()
+
+        self.assertEqual(analyzer.strongly_connected_components(), [[
+            NamespacedItem(name="ping", namespace="orders"),
+            NamespacedItem(name="pong", namespace="orders"),
+        ]])
+
+    def test_write_graphviz_streams_generated_dot(self):
+        """Verify write_graphviz writes the same document generate_graphviz returns."""
+        self._write_agent("shipper", (
+            "self.service_bus.subscribe(OrderPlaced.__name__, self.on_order)\n"
+            "self.service_bus.publish(OrderShipped.__name__, {})\n"
+        ))
+        analyzer = self._analyze()
+        output_path = self.project_root / "event_flow.dot"
+
+        with open(output_path, 'w', encoding='utf-8') as f:
+            analyzer.write_graphviz(f)
+
+        dot_content = output_path.read_text(encoding='utf-8')
+        self.assertEqual(dot_content, analyzer.generate_graphviz())
+        self.assertIn('"OrderPlaced" -> "shipper";', dot_content)
+        self.assertIn('"shipper" -> "OrderShipped";', dot_content)
+
+    def test_dunder_files_are_skipped(self):
+        """Verify files such as __init__.py are not treated as agents."""
+        self._write_agent("__init__", "self.service_bus.publish(OrderPlaced.__name__, {})\n")
+        analyzer = self._analyze()
+
+        self.assertEqual(analyzer.get_all_agents(), set())
+        self.assertEqual(analyzer.get_all_events(), set())
+
+    def test_only_python_files_are_agents(self):
+        """Verify only regular .py files directly in the agents directory are parsed."""
+        self._write_agent("shipper", "self.service_bus.publish(OrderShipped.__name__, {})\n")
+        (self.agents_dir / "notes.txt").write_text(
+            "self.service_bus.publish(OrderPlaced.__name__, {})\n"
+        )
+        (self.agents_dir / "package.py").mkdir()
+
+        analyzer = self._analyze()
+
+        self.assertEqual(
+            analyzer.get_all_agents(), {NamespacedItem(name="shipper", namespace="orders")}
+        )
+
+    def test_parse_cache_reparses_changed_files_only(self):
+        """Verify an analysis with a parse cache only parses new and modified files."""
+        self._write_agent(
+            "shipper", "self.service_bus.subscribe(OrderPlaced.__name__, self.on_order)\n"
+        )
+        self._write_agent(
+            "audit", "self.service_bus.subscribe(OrderShipped.__name__, self.on_shipped)\n"
+        )
+        parse_cache = AgentParseCache()
+
+        with patch.object(EventFlowAnalyzer, '_parse_file', autospec=True,
+                          side_effect=EventFlowAnalyzer._parse_file) as mock_parse:
+            EventFlowAnalyzer(self.agents_dir, self.events_dir).analyze(parse_cache=parse_cache)
+            self.assertEqual(mock_parse.call_count, 2)
+
+            self._write_agent("shipper", (
+                "self.service_bus.subscribe(OrderPlaced.__name__, self.on_order)\n"
+                "self.service_bus.publish(OrderShipped.__name__, {})\n"
+            ))
+            analyzer = EventFlowAnalyzer(self.agents_dir, self.events_dir)
+            analyzer.analyze(parse_cache=parse_cache)
+            self.assertEqual(mock_parse.call_count, 3)
+
+        self.assertEqual(analyzer.get_sorted_edges(), self._analyze().get_sorted_edges())
+
+        # Removed files leave the cache with the next analysis
+        (self.agents_dir / "audit.py").unlink()
+        EventFlowAnalyzer(self.agents_dir, self.events_dir).analyze(parse_cache=parse_cache)
+        self.assertEqual(len(parse_cache), 1)
+
+    def test_parse_cache_dropped_when_event_namespaces_change(self):
+        """Verify cached parse results are not reused once an event moves to another namespace."""
+        self._write_agent("shipper", "self.service_bus.publish(UserCreated.__name__, {})\n")
+        parse_cache = AgentParseCache()
+        EventFlowAnalyzer(self.agents_dir, self.events_dir).analyze(parse_cache=parse_cache)
+
+        (self.events_dir / "users" / "user_events.py").unlink()
+        (self.events_dir / "orders" / "user_events.py").write_text(
+            "class UserCreated(BaseModel):\n    pass\n"
+        )
+        analyzer = EventFlowAnalyzer(self.agents_dir, self.events_dir)
+        analyzer.analyze(parse_cache=parse_cache)
+
+        self.assertEqual(
+            analyzer.get_all_agents(), {NamespacedItem(name="shipper", namespace="orders")}
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
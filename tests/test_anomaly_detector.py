@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import sys
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+from python_pubsub_scanner.agent_graph import build_agent_graph
 from python_pubsub_scanner.analyze_event_flow import NamespacedItem
 from python_pubsub_scanner.anomaly_detector import AnomalyDetector
 
@@ -16,6 +18,16 @@ class TestAnomalyDetector(unittest.TestCase):
         """Set up mock analyzer for testing."""
         self.mock_analyzer = MagicMock()
 
+        # Derive the agent graph from whatever adjacency each test configures, as the analyzer does
+        def get_agent_graph():
+            return build_agent_graph(
+                self.mock_analyzer.get_all_agents(),
+                self.mock_analyzer.publications,
+                self.mock_analyzer.event_to_subscribers
+            )
+
+        self.mock_analyzer.get_agent_graph.side_effect = get_agent_graph
+
     def test_detect_orphaned_event_never_published(self):
         """Test detection of events that are never published."""
         # Create test events
@@ -112,6 +124,54 @@ class TestAnomalyDetector(unittest.TestCase):
         self.assertEqual(isolated[0]['agent'], 'IsolatedAgent')
         self.assertEqual(isolated[0]['severity'], 'info')
 
+    def test_detect_agents_with_empty_connections_as_isolated(self):
+        """Test that agents and events mapped to empty collections count as unconnected."""
+        agent = NamespacedItem(name="EmptyAgent", namespace="test")
+        event = NamespacedItem(name="EmptyEvent", namespace="test")
+
+        self.mock_analyzer.get_all_agents.return_value = {agent}
+        self.mock_analyzer.get_all_events.return_value = {event}
+        self.mock_analyzer.publications = {agent: []}
+        self.mock_analyzer.subscriptions = {agent: []}
+        self.mock_analyzer.event_to_publishers = {event: []}
+        self.mock_analyzer.event_to_subscribers = {event: []}
+
+        detector = AnomalyDetector(self.mock_analyzer)
+
+        self.assertEqual([i['agent'] for i in detector.detect_isolated_agents()], ['EmptyAgent'])
+        self.assertEqual(
+            sorted(o['type'] for o in detector.detect_orphaned_events()),
+            ['never_published', 'never_subscribed']
+        )
+
+        # Once invalidated, the detectors see the analyzer's new connections
+        self.mock_analyzer.publications = {agent: [event]}
+        self.mock_analyzer.event_to_publishers = {event: [agent]}
+        detector.invalidate()
+
+        self.assertEqual(detector.detect_isolated_agents(), [])
+        self.assertEqual(
+            [o['type'] for o in detector.detect_orphaned_events()], ['never_subscribed']
+        )
+
+    def test_isolated_agents_are_sorted(self):
+        """Test that isolated agents are reported in (namespace, name) order."""
+        agents = [
+            NamespacedItem(name="Zed", namespace="alpha"),
+            NamespacedItem(name="Bee", namespace="beta"),
+            NamespacedItem(name="Ant", namespace="alpha"),
+        ]
+        self.mock_analyzer.get_all_agents.return_value = set(agents)
+        self.mock_analyzer.publications = {}
+        self.mock_analyzer.subscriptions = {}
+
+        detector = AnomalyDetector(self.mock_analyzer)
+        isolated = detector.detect_isolated_agents()
+
+        self.assertEqual([(i['namespace'], i['agent']) for i in isolated], [
+            ('alpha', 'Ant'), ('alpha', 'Zed'), ('beta', 'Bee')
+        ])
+
     def test_detect_no_isolated_agents(self):
         """Test that no isolated agents are detected when all are connected."""
         agent_pub = NamespacedItem(name="Publisher", namespace="test")
@@ -162,6 +222,53 @@ class TestAnomalyDetector(unittest.TestCase):
         self.assertIn('AgentA', cycle['cycle'])
         self.assertIn('AgentB', cycle['cycle'])
 
+    def test_detect_every_cycle(self):
+        """Test that separate cycles are each reported, with the events linking the agents."""
+        agents = {
+            name: NamespacedItem(name=name, namespace="test") for name in ("A", "B", "C", "D")
+        }
+        events = {
+            name: NamespacedItem(name=name, namespace="test") for name in ("AB", "BA", "CD", "DC")
+        }
+
+        # A <-> B and C <-> D
+        self.mock_analyzer.get_all_agents.return_value = set(agents.values())
+        self.mock_analyzer.publications = {
+            agents[name[0]]: [events[name]] for name in events
+        }
+        self.mock_analyzer.event_to_subscribers = {
+            events[name]: [agents[name[1]]] for name in events
+        }
+
+        detector = AnomalyDetector(self.mock_analyzer)
+        cycles = detector.detect_cycles()
+
+        self.assertEqual(sorted(c['cycle'] for c in cycles), [['A', 'B'], ['C', 'D']])
+        ab_cycle = next(c for c in cycles if c['cycle'] == ['A', 'B'])
+        self.assertEqual(ab_cycle['path'], [
+            {'agent': 'A', 'namespace': 'test', 'publishes': ['AB']},
+            {'agent': 'B', 'namespace': 'test', 'publishes': ['BA']},
+        ])
+        self.assertEqual(ab_cycle['message'], "Circular dependency detected: A -> B -> A")
+
+    def test_detect_long_cycle(self):
+        """Test that a cycle longer than the recursion limit is detected."""
+        length = sys.getrecursionlimit() + 100
+        agents = [NamespacedItem(name=f"Agent{i:05d}", namespace="test") for i in range(length)]
+        events = [NamespacedItem(name=f"Event{i:05d}", namespace="test") for i in range(length)]
+
+        self.mock_analyzer.get_all_agents.return_value = set(agents)
+        self.mock_analyzer.publications = {agents[i]: [events[i]] for i in range(length)}
+        self.mock_analyzer.event_to_subscribers = {
+            events[i]: [agents[(i + 1) % length]] for i in range(length)
+        }
+
+        detector = AnomalyDetector(self.mock_analyzer)
+        cycles = detector.detect_cycles()
+
+        self.assertEqual(len(cycles), 1)
+        self.assertEqual(len(cycles[0]['cycle']), length)
+
     def test_detect_no_cycles(self):
         """Test that no cycles are detected in a linear flow."""
         agent_a = NamespacedItem(name="AgentA", namespace="test")
@@ -251,6 +358,38 @@ class TestAnomalyDetector(unittest.TestCase):
         self.assertGreater(summary['isolated_agents_count'], 0)
         self.assertGreater(summary['total_anomalies'], 0)
 
+    def test_detections_run_once(self):
+        """Test that detect_all and get_anomaly_summary share a single detection pass."""
+        agent = NamespacedItem(name="Agent", namespace="test")
+
+        self.mock_analyzer.get_all_agents.return_value = {agent}
+        self.mock_analyzer.get_all_events.return_value = set()
+        self.mock_analyzer.publications = {}
+        self.mock_analyzer.subscriptions = {}
+        self.mock_analyzer.event_to_publishers = {}
+        self.mock_analyzer.event_to_subscribers = {}
+
+        detector = AnomalyDetector(self.mock_analyzer)
+        with patch.object(detector, 'detect_cycles', wraps=detector.detect_cycles) as detect_cycles:
+            anomalies = detector.detect_all()
+            detector.get_anomaly_summary()
+            self.assertEqual(detector.detect_all(), anomalies)
+            self.assertEqual(detect_cycles.call_count, 1)
+
+            # Each report is a copy, so altering one leaves the cached result intact
+            anomalies['isolated_agents'].clear()
+            self.assertEqual(len(detector.detect_all()['isolated_agents']), 1)
+
+            # The summary only reads counts kept with the cached result
+            summary = detector.get_anomaly_summary()
+            summary['total_anomalies'] = -1
+            self.assertEqual(detector.get_anomaly_summary()['total_anomalies'], 1)
+
+            # After invalidation the detections run again against the current analyzer data
+            detector.invalidate()
+            detector.detect_all()
+            self.assertEqual(detect_cycles.call_count, 2)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import os
 import tempfile
 import unittest
 from pathlib import Path
 from typing import Any, Dict
+from unittest.mock import patch
 
 import yaml
 
@@ -44,7 +46,7 @@ class TestConfigHelper(unittest.TestCase):
 
     def _write_config(self, data):
         with open(self.project_root / "event_flow_config.yaml", "w") as f:
-            yaml.dump(data, f)
+            yaml.dump(data, f, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper))
 
     def test_successful_init_from_script_path(self):
         """Verify successful initialization when starting from a subdirectory."""
@@ -56,6 +58,27 @@ class TestConfigHelper(unittest.TestCase):
         self.assertEqual(helper.get_events_path(), self.events_dir)
         self.assertIsNone(helper.get_postman_path(), "Postman path should be None as it does not exist yet")
 
+    def test_init_from_file_path_and_venv_configs_skipped(self):
+        """Verify the search starts next to a file, and skips configs inside a .venv directory."""
+        self._write_config(self.config_data)
+        venv_dir = self.project_root / ".venv" / "lib"
+        venv_dir.mkdir(parents=True)
+        (self.project_root / ".venv" / "event_flow_config.yaml").write_text(
+            "agents_dir: ./nowhere\n"
+        )
+        script = venv_dir / "script.py"
+        script.write_text("")
+
+        helper = ConfigHelper(start_path=script, config_file_name="event_flow_config.yaml")
+
+        self.assertEqual(helper.project_root, self.project_root)
+        self.assertEqual(helper.config_path, self.project_root / "event_flow_config.yaml")
+
+    def test_raises_error_if_config_not_found(self):
+        """Verify it raises FileNotFoundError when no parent directory holds the config file."""
+        with self.assertRaises(FileNotFoundError):
+            ConfigHelper(start_path=self.start_dir, config_file_name="missing_config.yaml")
+
     def test_raises_error_if_required_dir_missing(self):
         """Verify it raises FileNotFoundError if a configured directory does not exist."""
         self.config_data["agents_dir"] = "./src/non_existent_agents"
@@ -92,6 +115,36 @@ class TestConfigHelper(unittest.TestCase):
         helper = ConfigHelper(start_path=self.start_dir, config_file_name="event_flow_config.yaml")
         self.assertIsNone(helper.get_postman_path())
 
+    def test_unchanged_config_is_parsed_once(self):
+        """Verify an unchanged config file is served from the parse cache, and edits picked up."""
+        self._write_config(self.config_data)
+        config_file = self.project_root / "event_flow_config.yaml"
+
+        with patch("python_pubsub_scanner.config_helper.yaml.load", wraps=yaml.load) as load:
+            first = ConfigHelper(
+                start_path=self.start_dir, config_file_name="event_flow_config.yaml"
+            )
+            first.config["port"] = 1  # Mutating one helper must not leak into the cache
+            second = ConfigHelper(
+                start_path=self.start_dir, config_file_name="event_flow_config.yaml"
+            )
+            self.assertEqual(load.call_count, 1)
+            self.assertEqual(second.config["port"], 9999)
+
+            self.config_data["port"] = 8888
+            self._write_config(self.config_data)
+            stat_result = config_file.stat()
+            os.utime(
+                config_file,
+                ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000)
+            )
+
+            third = ConfigHelper(
+                start_path=self.start_dir, config_file_name="event_flow_config.yaml"
+            )
+            self.assertEqual(load.call_count, 2)
+            self.assertEqual(third.config["port"], 8888)
+
     def test_get_namespaces_colors(self):
         """Verify it correctly returns namespace color mappings from config."""
         self.config_data["namespaces_colors"] = {
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import tempfile
 import unittest
 from pathlib import Path
@@ -7,7 +8,11 @@ from unittest.mock import MagicMock
 
 import graphviz
 
-from python_pubsub_scanner.analyze_event_flow import EventFlowAnalyzer, NamespacedItem
+from python_pubsub_scanner.analyze_event_flow import (
+    DOT_EDGE_TEMPLATE,
+    EventFlowAnalyzer,
+    NamespacedItem
+)
 from python_pubsub_scanner.graph_generators import (
     get_generator,
     register_generator,
@@ -16,6 +21,10 @@ from python_pubsub_scanner.graph_generators import (
     CompleteGraphGenerator,
     FullTreeGraphGenerator
 )
+from python_pubsub_scanner.generate_hierarchical_tree import (
+    hierarchical_tree_to_string,
+    write_hierarchical_tree
+)
 
 
 class TestGraphGenerators(unittest.TestCase):
@@ -39,6 +48,21 @@ class TestGraphGenerators(unittest.TestCase):
         self.mock_analyzer.subscriptions = {self.agent_one: [self.event_one]}
         self.mock_analyzer.publications = {self.agent_two: [self.event_two]}
         self.mock_analyzer.event_to_subscribers = {self.event_one: [self.agent_one]}
+        self.mock_analyzer.get_sorted_events.return_value = (self.event_one, self.event_two)
+        self.mock_analyzer.get_sorted_agents.return_value = (self.agent_one, self.agent_two)
+        # Edges derived from the adjacency above, in DOT order: subscriptions, then publications
+        edges = tuple(
+            [(event.name, agent.name)
+             for event, agents in sorted(self.mock_analyzer.event_to_subscribers.items())
+             for agent in sorted(agents)]
+            + [(agent.name, event.name)
+               for agent, events in sorted(self.mock_analyzer.publications.items())
+               for event in sorted(events)]
+        )
+        self.mock_analyzer.get_sorted_edges.return_value = edges
+        self.mock_analyzer.get_dot_edges.return_value = ''.join(
+            DOT_EDGE_TEMPLATE % edge for edge in edges
+        )
 
     def test_available_generators(self):
         """Verify that the list of available generators includes expected types."""
@@ -123,20 +147,15 @@ class TestGraphGenerators(unittest.TestCase):
         """Verify CompleteGraphGenerator can write output to a file."""
         generator = CompleteGraphGenerator()
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.dot', delete=False) as f:
-            output_path = f.name
-
-        try:
-            dot_content = generator.generate(self.mock_analyzer, output_path=output_path)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = Path(temp_dir) / "complete.dot"
+            dot_content = generator.generate(self.mock_analyzer, output_path=str(output_path))
 
             # Verify the file was created and contains the same content
-            with open(output_path, 'r') as f:
-                file_content = f.read()
+            file_content = output_path.read_text(encoding='utf-8')
 
-            self.assertEqual(dot_content, file_content)
-            self.assertIn('digraph EventFlow', file_content)
-        finally:
-            Path(output_path).unlink()
+        self.assertEqual(dot_content, file_content)
+        self.assertIn('digraph EventFlow', file_content)
 
     def test_full_tree_generator_produces_valid_dot(self):
         """Verify FullTreeGraphGenerator produces valid DOT content."""
@@ -152,6 +171,47 @@ class TestGraphGenerators(unittest.TestCase):
         # Verify content includes expected elements
         self.assertIn('digraph EventFlow', dot_content)
 
+    def test_full_tree_generator_writes_to_file(self):
+        """Verify FullTreeGraphGenerator writes the returned content to the output file."""
+        generator = FullTreeGraphGenerator()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = Path(temp_dir) / "tree.dot"
+            dot_content = generator.generate(self.mock_analyzer, output_path=str(output_path))
+
+            self.assertEqual(output_path.read_text(encoding='utf-8'), dot_content)
+            self.assertEqual(sorted(p.name for p in Path(temp_dir).iterdir()), ["tree.dot"])
+
+        self.assertEqual(generator.generate(self.mock_analyzer), dot_content)
+
+    def test_generators_stream_to_file_without_content(self):
+        """Verify return_content=False writes the same file and returns an empty string."""
+        for generator in (CompleteGraphGenerator(), FullTreeGraphGenerator()):
+            with self.subTest(graph_type=generator.graph_type), \
+                    tempfile.TemporaryDirectory() as temp_dir:
+                output_path = Path(temp_dir) / "graph.dot"
+                result = generator.generate(
+                    self.mock_analyzer, output_path=str(output_path), return_content=False
+                )
+
+                self.assertEqual(result, '')
+                self.assertEqual(
+                    output_path.read_text(encoding='utf-8'), generator.generate(self.mock_analyzer)
+                )
+
+    def test_generators_stream_to_text_stream(self):
+        """Verify the streaming writers produce the same document as the string APIs."""
+        generator = CompleteGraphGenerator()
+        buffer = io.StringIO()
+        generator.write(self.mock_analyzer, buffer)
+        self.assertEqual(buffer.getvalue(), generator.generate(self.mock_analyzer))
+
+        buffer = io.StringIO()
+        write_hierarchical_tree(self.mock_analyzer, buffer)
+        self.assertEqual(buffer.getvalue(), hierarchical_tree_to_string(self.mock_analyzer))
+        self.assertIn('"EventOne" -> "AgentOne";', buffer.getvalue())
+        self.assertTrue(buffer.getvalue().endswith('}'))
+
     def test_register_custom_generator(self):
         """Verify that custom generators can be registered."""
 
@@ -161,7 +221,7 @@ class TestGraphGenerators(unittest.TestCase):
             def graph_type(self) -> str:
                 return "custom"
 
-            def generate(self, analyzer, output_path=None) -> str:
+            def generate(self, analyzer, output_path=None, return_content=True) -> str:
                 return "digraph Custom { }"
 
         # Register the custom generator
@@ -170,6 +230,7 @@ class TestGraphGenerators(unittest.TestCase):
         # Verify we can get it (which proves it was registered)
         generator = get_generator('custom')
         self.assertIsInstance(generator, CustomGenerator)
+        self.assertIn('custom', AVAILABLE_GENERATORS)
 
         # Verify it generates content
         dot_content = generator.generate(self.mock_analyzer)
@@ -185,5 +246,53 @@ class TestGraphGenerators(unittest.TestCase):
         self.assertIn('class="namespace-test_agents"', dot_content)
 
 
+class TestWritersOnRealAnalyzer(unittest.TestCase):
+    """
+    Tests that every DOT writer derives its edges from a real EventFlowAnalyzer's adjacency.
+    """
+
+    def setUp(self):
+        """Analyze a small project: AgentOne consumes EventOne, AgentTwo publishes EventTwo."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        project_root = Path(self.temp_dir.name)
+        agents_dir = project_root / "agents"
+        events_dir = project_root / "events"
+        agents_dir.mkdir()
+        (events_dir / "test_namespace").mkdir(parents=True)
+
+        (events_dir / "test_namespace" / "events.py").write_text(
+            "class EventOne(BaseModel):\n    pass\n\n"
+            "class EventTwo(BaseModel):\n    pass\n"
+        )
+        (agents_dir / "AgentOne.py").write_text(
+            "self.service_bus.subscribe(EventOne.__name__, self.on_event)\n"
+        )
+        (agents_dir / "AgentTwo.py").write_text(
+            "self.service_bus.publish(EventTwo.__name__, {})\n"
+        )
+
+        self.analyzer = EventFlowAnalyzer(agents_dir, events_dir)
+        self.analyzer.analyze()
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_writers_emit_analyzed_edges(self):
+        """Verify each writer outputs exactly the edges found by the analysis, in DOT order."""
+        expected_edges = ['    "EventOne" -> "AgentOne";', '    "AgentTwo" -> "EventTwo";']
+        outputs = {
+            'complete': CompleteGraphGenerator().generate(self.analyzer),
+            'full-tree': FullTreeGraphGenerator().generate(self.analyzer),
+            'hierarchical-tree': hierarchical_tree_to_string(self.analyzer),
+            'analyzer': self.analyzer.generate_graphviz(),
+        }
+
+        for writer, dot_content in outputs.items():
+            with self.subTest(writer=writer):
+                edges = [line for line in dot_content.splitlines() if ' -> ' in line]
+                self.assertEqual(edges, expected_edges)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -2,14 +2,17 @@ from __future__ import annotations
 
 import json
 import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import graphviz
 
-from python_pubsub_scanner.analyze_event_flow import NamespacedItem
+from python_pubsub_scanner.analyze_event_flow import DOT_EDGE_TEMPLATE, NamespacedItem
 from python_pubsub_scanner.config_helper import ConfigHelper
+from python_pubsub_scanner.graph_generators import get_generator
 from python_pubsub_scanner.scanner import EventFlowScanner
 
 
@@ -34,10 +37,11 @@ class TestScannerPayload(unittest.TestCase):
         self.postman_dir.mkdir()
 
         # 2. Mock external services and analyzers
-        self.requests_post_patcher = patch('python_pubsub_scanner.scanner.requests.post')
+        self.requests_session_patcher = patch('python_pubsub_scanner.scanner.requests.Session')
         self.analyzer_class_patcher = patch('python_pubsub_scanner.scanner.EventFlowAnalyzer')
 
-        self.mock_post = self.requests_post_patcher.start()
+        self.mock_session_class = self.requests_session_patcher.start()
+        self.mock_post = self.mock_session_class.return_value.post
         self.mock_analyzer_class = self.analyzer_class_patcher.start()
 
         # 3. Configure standard mock behaviors
@@ -54,6 +58,26 @@ class TestScannerPayload(unittest.TestCase):
         mock_analyzer_instance.subscriptions = {agent_one: [event_one]}
         mock_analyzer_instance.publications = {agent_two: [event_two]}
         mock_analyzer_instance.event_to_subscribers = {event_one: [agent_one]}
+        mock_analyzer_instance.get_sorted_events.return_value = (event_one, event_two)
+        mock_analyzer_instance.get_sorted_agents.return_value = (agent_one, agent_two)
+
+        # Edges follow whatever adjacency a test configures, in DOT order:
+        # subscriptions, then publications
+        def get_sorted_edges():
+            return tuple(
+                [(event.name, agent.name)
+                 for event, agents in sorted(mock_analyzer_instance.event_to_subscribers.items())
+                 for agent in sorted(agents)]
+                + [(agent.name, event.name)
+                   for agent, events in sorted(mock_analyzer_instance.publications.items())
+                   for event in sorted(events)]
+            )
+
+        def get_dot_edges():
+            return ''.join(DOT_EDGE_TEMPLATE % edge for edge in get_sorted_edges())
+
+        mock_analyzer_instance.get_sorted_edges.side_effect = get_sorted_edges
+        mock_analyzer_instance.get_dot_edges.side_effect = get_dot_edges
         self.mock_analyzer_class.return_value = mock_analyzer_instance
 
         self.mock_post.return_value.status_code = 201
@@ -73,13 +97,12 @@ class TestScannerPayload(unittest.TestCase):
         scanner = EventFlowScanner(agents_dir=self.agents_dir, events_dir=self.events_dir)
         scanner.scan_once()
 
-        self.assertTrue(self.mock_post.called, "requests.post was not called")
+        self.assertTrue(self.mock_post.called, "session.post was not called")
         _, first_call_kwargs = self.mock_post.call_args_list[0]
-        payload = first_call_kwargs.get('json')
+        payload = json.loads(first_call_kwargs['data'])
 
-        self.assertIn('stats', payload)
-        self.assertEqual(payload['stats']['events'], 2)
-        self.assertEqual(payload['stats']['agents'], 2)
+        self.assertEqual(payload['stats'], {'events': 2, 'agents': 2, 'connections': 2})
+        self.assertEqual(payload['namespaces'], ['test_agents', 'test_namespace'])
 
     def test_dot_content_compliance(self):
         """
@@ -88,14 +111,17 @@ class TestScannerPayload(unittest.TestCase):
         scanner = EventFlowScanner(agents_dir=self.agents_dir, events_dir=self.events_dir)
         scanner.scan_once()
 
-        self.assertTrue(self.mock_post.called)
-        _, kwargs = self.mock_post.call_args_list[0]
-        dot_content = kwargs.get('json', {}).get('dot_content')
+        self.assertEqual(self.mock_post.call_count, 2)
+        for _, kwargs in self.mock_post.call_args_list:
+            payload = json.loads(kwargs['data'])
+            with self.subTest(graph_type=payload['graph_type']):
+                dot_content = payload['dot_content']
+                self.assertTrue(dot_content.startswith('digraph EventFlow {'))
 
-        try:
-            graphviz.Source(dot_content)
-        except Exception as e:
-            self.fail(f"graphviz failed to parse dot_content. Error: {e}")
+                try:
+                    graphviz.Source(dot_content)
+                except Exception as e:
+                    self.fail(f"graphviz failed to parse dot_content. Error: {e}")
 
     def test_serialization_to_json(self):
         """
@@ -106,12 +132,184 @@ class TestScannerPayload(unittest.TestCase):
 
         self.assertTrue(self.mock_post.called)
         _, kwargs = self.mock_post.call_args_list[0]
-        payload = kwargs.get('json')
+        body = kwargs['data']
 
+        self.assertIsInstance(body, bytes)
         try:
-            json.dumps(payload)
-        except TypeError as e:
-            self.fail(f"Payload is not JSON serializable. Error: {e}")
+            payload = json.loads(body.decode('utf-8'))
+        except ValueError as e:
+            self.fail(f"Payload is not valid JSON. Error: {e}")
+        self.assertIn(payload['graph_type'], ('complete', 'full-tree'))
+
+    def test_scan_once_returns_summary(self):
+        """
+        Verify scan_once returns the per-graph results together with the success tally.
+        """
+        self.mock_post.return_value.status_code = 500
+        self.mock_post.return_value.text = "Internal Server Error"
+
+        scanner = EventFlowScanner(agents_dir=self.agents_dir, events_dir=self.events_dir)
+        summary = scanner.scan_once()
+
+        self.assertEqual(summary, {'complete': False, 'full-tree': False})
+        self.assertEqual(summary.successes, 0)
+        self.assertEqual(summary.total, 2)
+
+        self.mock_post.return_value.status_code = 201
+        summary = scanner.scan_once()
+
+        self.assertEqual(summary, {'complete': True, 'full-tree': True})
+        self.assertEqual(summary.successes, 2)
+        self.assertEqual(summary.total, 2)
+
+    def test_anomalies_detected_once_per_scan(self):
+        """
+        Verify anomalies are detected once per scan and shipped with every graph payload.
+        """
+        with patch('python_pubsub_scanner.scanner.AnomalyDetector') as mock_detector_class:
+            mock_detector = mock_detector_class.return_value
+            mock_detector.get_anomaly_summary.return_value = {'total_anomalies': 0}
+            mock_detector.detect_all.return_value = {'cycles': []}
+
+            scanner = EventFlowScanner(agents_dir=self.agents_dir, events_dir=self.events_dir)
+            scanner.scan_once()
+
+        self.assertEqual(mock_detector_class.call_count, 1)
+        self.assertEqual(self.mock_post.call_count, 2)
+        for _, kwargs in self.mock_post.call_args_list:
+            self.assertEqual(json.loads(kwargs['data'])['anomalies'], {
+                'summary': {'total_anomalies': 0},
+                'details': {'cycles': []}
+            })
+
+    def test_unchanged_sources_reuse_previous_analysis(self):
+        """
+        Verify repeated scans only re-analyze when an agent or event file changed.
+        """
+        agent_file = self.agents_dir / "agent.py"
+        agent_file.write_text("pass\n")
+
+        scanner = EventFlowScanner(agents_dir=self.agents_dir, events_dir=self.events_dir)
+        scanner.scan_once()
+        scanner.scan_once()
+
+        self.assertEqual(self.mock_analyzer_class.call_count, 1)
+
+        (self.events_dir / "orders").mkdir()
+        (self.events_dir / "orders" / "order_events.py").write_text(
+            "class OrderPlaced:\n    pass\n"
+        )
+        scanner.scan_once()
+
+        self.assertEqual(self.mock_analyzer_class.call_count, 2)
+
+    def test_unchanged_graphs_are_not_pushed_again(self):
+        """
+        Verify a graph identical to the last accepted push is skipped, and pushed again once
+        it changes.
+        """
+        scanner = EventFlowScanner(agents_dir=self.agents_dir, events_dir=self.events_dir)
+        scanner.scan_once()
+        self.assertEqual(self.mock_post.call_count, 2)
+
+        summary = scanner.scan_once()
+        self.assertEqual(self.mock_post.call_count, 2)
+        self.assertEqual(summary.successes, 2)
+
+        # A new subscription adds an edge to both graphs
+        analyzer = self.mock_analyzer_class.return_value
+        event_two = NamespacedItem(name="EventTwo", namespace="test_namespace")
+        agent_one = NamespacedItem(name="AgentOne", namespace="test_agents")
+        analyzer.event_to_subscribers[event_two] = [agent_one]
+        (self.agents_dir / "new_agent.py").write_text("pass\n")
+        scanner.scan_once()
+        self.assertEqual(self.mock_post.call_count, 4)
+
+    def test_generators_reused_across_scans(self):
+        """
+        Verify each graph generator is created once and reused when sources change.
+        """
+        scanner = EventFlowScanner(agents_dir=self.agents_dir, events_dir=self.events_dir)
+        with patch(
+                'python_pubsub_scanner.scanner.get_generator', wraps=get_generator
+        ) as mock_get_generator:
+            scanner.scan_once()
+            (self.agents_dir / "new_agent.py").write_text("pass\n")
+            scanner.scan_once()
+
+        self.assertEqual(self.mock_analyzer_class.call_count, 2)
+        self.assertEqual(sorted(c.kwargs['graph_type'] for c in mock_get_generator.call_args_list),
+                         ['complete', 'full-tree'])
+
+    def test_pushes_share_one_session(self):
+        """
+        Verify every push of every scan goes through a single keep-alive session.
+        """
+        scanner = EventFlowScanner(agents_dir=self.agents_dir, events_dir=self.events_dir)
+        self.mock_post.return_value.status_code = 500
+        scanner.scan_once()
+        self.mock_post.return_value.status_code = 201
+        scanner.scan_once()
+
+        self.assertEqual(self.mock_session_class.call_count, 1)
+        self.assertEqual(self.mock_post.call_count, 4)
+
+    def test_postman_collection_generated_once(self):
+        """
+        Verify the Postman collection is generated once although graphs are pushed concurrently.
+        """
+        scanner = EventFlowScanner(
+            agents_dir=self.agents_dir,
+            events_dir=self.events_dir,
+            postman_dir=self.postman_dir
+        )
+        with patch.object(scanner, '_generate_postman_collection') as mock_generate:
+            summary = scanner.scan_once()
+
+        self.assertEqual(list(summary), ['complete', 'full-tree'])
+        self.assertEqual(self.mock_post.call_count, 2)
+        self.assertEqual(mock_generate.call_count, 1)
+
+    def test_stop_interrupts_continuous_sleep(self):
+        """
+        Verify stop() ends continuous mode without waiting for the interval to elapse.
+        """
+        scanner = EventFlowScanner(
+            agents_dir=self.agents_dir, events_dir=self.events_dir, interval=3600
+        )
+
+        def stop_soon():
+            threading.Timer(0.05, scanner.stop).start()
+
+        with patch.object(scanner, 'scan_once', side_effect=stop_soon) as mock_scan_once:
+            started = time.monotonic()
+            scanner.run_continuous()
+
+        self.assertLess(time.monotonic() - started, 60)
+        self.assertEqual(mock_scan_once.call_count, 1)
+        self.mock_session_class.return_value.close.assert_called_once_with()
+
+    def test_continuous_mode_keeps_a_fixed_cadence(self):
+        """
+        Verify the sleep between scans absorbs the scan duration, and missed ticks are skipped.
+        """
+        scanner = EventFlowScanner(
+            agents_dir=self.agents_dir, events_dir=self.events_dir, interval=10
+        )
+        clock = iter([100.0, 103.0, 135.0])  # Start, then after a 3s scan, then after a 25s scan
+        waits = []
+
+        def wait(timeout):
+            waits.append(timeout)
+            return len(waits) == 2
+
+        with patch('python_pubsub_scanner.scanner._monotonic', side_effect=lambda: next(clock)), \
+                patch.object(scanner, 'scan_once'), \
+                patch.object(scanner._stop_event, 'wait', side_effect=wait):
+            scanner.run_continuous()
+
+        # Ticks at 110, then 120 and 130 are missed by the long scan: next one at 140
+        self.assertEqual(waits, [7.0, 5.0])
 
     def test_from_config_factory_method(self):
         """
@@ -170,9 +368,9 @@ class TestScannerPayload(unittest.TestCase):
         scanner = EventFlowScanner(agents_dir=self.agents_dir, events_dir=self.events_dir)
         scanner.scan_once()
 
-        self.assertTrue(self.mock_post.called, "requests.post was not called")
+        self.assertTrue(self.mock_post.called, "session.post was not called")
         _, first_call_kwargs = self.mock_post.call_args_list[0]
-        payload = first_call_kwargs.get('json')
+        payload = json.loads(first_call_kwargs['data'])
 
         # Verify original keys are still present (no regression)
         self.assertIn('stats', payload)